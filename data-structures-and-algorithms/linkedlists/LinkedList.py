@@ -1,3 +1,10 @@
+import json
+from array import array
+from functools import reduce
+from heapq import merge
+from itertools import islice
+
+
 class Node:
     """A node in a linked list.
 
@@ -6,6 +13,7 @@ class Node:
     - next (Node): the next Node in the list, or None if this
                    is the last Node
     """
+    __slots__ = ('item', 'next')
 
     def __init__(self, item):
         """ (Node, object) -> NoneType
@@ -15,29 +23,274 @@ class Node:
         self.next = None  # Initially pointing to nothing
 
 
-class LinkedList:
+class DoublyNode(Node):
+    """A node in a doubly linked list.
+
+    Attributes:
+    - item (object): the data stored in this node
+    - next (DoublyNode): the next node in the list, or None if this
+                         is the last node
+    - prev (DoublyNode): the previous node in the list, or None if this
+                         is the first node
+    """
+    __slots__ = ('prev',)
+
+    def __init__(self, item):
+        """ (DoublyNode, object) -> NoneType
+        Create a new node storing item, pointing to nothing.
+        """
+        Node.__init__(self, item)
+        self.prev = None
+
+
+class ListMixin:
+    """Methods shared by the list classes in this package.
+
+    They only use len and iteration, so a class that inherits them must
+    define __len__ and __iter__, and may override any of them with a
+    faster version.
+    """
+
+    repr_limit = 20    # most items shown by repr
+
+    def _check_index(self, index):
+        """ (ListMixin, int) -> int
+
+        Return index as a position in this list, counting a negative
+        index from the end, as Python lists do.
+        Raise IndexError if there is no such position.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError
+        return index
+
+
+    def __contains__(self, item):
+        """ (ListMixin, object) -> bool
+        Return True if item is in this list.
+        """
+        for other in self:
+            if item == other:
+                return True
+        return False
+
+
+    def __reversed__(self):
+        """ (ListMixin) -> iterator
+
+        Return an iterator over the items in this list from last to first.
+        The nodes only point forwards, so this copies the items first.
+        """
+        items = list(self)
+        items.reverse()
+        return iter(items)
+
+
+    def __repr__(self):
+        """ (ListMixin) -> str
+
+        Return a representation of this list showing at most its first
+        repr_limit items, so that huge lists are quick to log.
+        >>> repr(LinkedList([1, 2, 3]))
+        'LinkedList([1, 2, 3])'
+        """
+        parts = [repr(item) for item in islice(self, self.repr_limit)]
+        if len(self) > self.repr_limit:
+            parts.append("...")
+        return type(self).__name__ + "([" + ", ".join(parts) + "])"
+
+
+    def __eq__(self, other):
+        """ (ListMixin, object) -> bool
+
+        Return True if other is a list of the same class (or a subclass)
+        with equal items, in the same order.
+        """
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        elif len(self) != len(other):
+            return False
+
+        for item, other_item in zip(self, other):
+            if not (item == other_item):
+                return False
+        return True
+
+
+class LinkedList(ListMixin):
     """A linked list implementation of the List ADT.
 
     Attributes:
     - first (Node): the first node in the list, or
                     None if the list is empty
+    - last (Node): the last node in the list, or
+                   None if the list is empty
+
+    The list also keeps count of its nodes. Every method that adds or
+    removes nodes does so through _insert_after and _remove_after, which
+    keep last and the count up to date, and forget the cached digest.
     """
 
-    def __init__(self, items):
-        """ (LinkedList, list) -> NoneType
+    _CHUNK = 4096      # items written or read at a time when streaming
+
+    # True if every change to an item goes through the hooks, so that
+    # == may trust two cached digests that differ
+    _eq_uses_digest = True
+
+    def __init__(self, items=()):
+        """ (LinkedList, iterable) -> NoneType
 
         Create Node objects linked together in the order provided in items.
         Set the first node of the list as the first item in items.
+        items can be any iterable, including a generator; it is read
+        once, without being copied.
+        """
+        self.first = None
+        self.last = None
+        self._length = 0
+        self._digest = None
+        self.extend(items)
+
+
+    def extend(self, items):
+        """ (LinkedList, iterable) -> NoneType
+
+        Add every item in items to the end of this list, in order.
+        Takes O(k) time for k items, and never copies items.
+        """
+        if items is self:
+            # Copy the items first, or this would never stop.
+            items = list(self)
+
+        for item in items:
+            self._insert_after(self.last, self._make_node(item))
+
+
+    def __iadd__(self, items):
+        """ (LinkedList, iterable) -> LinkedList
+
+        Add every item in items to the end of this list, in order.
+        """
+        self.extend(items)
+        return self
+
+
+    def _make_node(self, item):
+        """ (LinkedList, object) -> Node
+        Return a new, unlinked node storing item.
+        """
+        return Node(item)
+
+
+    def _from_items(self, items):
+        """ (LinkedList, iterable) -> LinkedList
+        Return a new list like this one, of the items in items.
+        """
+        return type(self)(items)
+
+
+    def _node_before(self, index):
+        """ (LinkedList, int) -> Node
+
+        Return the node at position index - 1, or None if index is 0.
+        Precondition: 0 <= index <= len(self).
+        """
+        if index == 0:
+            return None
+        elif index == self._length:
+            return self.last
+        
+        curr = self.first
+        for i in range(index - 1):
+            curr = curr.next
+        return curr
+
+
+    def _insert_after(self, prev, new_node):
+        """ (LinkedList, Node, Node) -> NoneType
+
+        Link new_node into this list right after prev,
+        or at the front of the list if prev is None.
+        """
+        if prev is None:
+            new_node.next = self.first
+            self.first = new_node
+        else:
+            new_node.next = prev.next
+            prev.next = new_node
+
+        if new_node.next is None:
+            self.last = new_node
+        self._length += 1
+        self._digest = None
+
+
+    def _remove_after(self, prev):
+        """ (LinkedList, Node) -> object
+
+        Unlink the node right after prev, or the first node if prev
+        is None, and return its item.
+        Raise AttributeError, without changing the list, if there
+        is no such node.
+        """
+        if prev is None:
+            node = self.first
+            self.first = node.next
+        else:
+            node = prev.next
+            prev.next = node.next
+
+        if node.next is None:
+            self.last = prev
+        self._length -= 1
+        self._digest = None
+        return node.item
+
+
+    def _set_item(self, node, item):
+        """ (LinkedList, Node, object) -> NoneType
+        Replace the item stored in node, a node of this list.
+        """
+        node.item = item
+        self._digest = None
+
+
+    def _reset(self):
+        """ (LinkedList) -> NoneType
+
+        Forget every node of this list, leaving it empty, e.g. after
+        its nodes have been moved into another list.
         """
+        self.first = None
+        self.last = None
+        self._length = 0
+        self._digest = None
 
-        if len(items) == 0:  # No items, and an empty list!
-            self.first = None
+
+    def _splice_after(self, prev, other):
+        """ (LinkedList, Node, LinkedList) -> NoneType
+
+        Precondition: other is not empty.
+
+        Link all of the nodes of other into this list right after prev,
+        or at the front of the list if prev is None, and empty other.
+        """
+        first, last, length = other.first, other.last, len(other)
+        other._reset()
+
+        if prev is None:
+            last.next = self.first
+            self.first = first
         else:
-            self.first = Node(items[0])
-            current_node = self.first
-            for item in items[1:]:
-                current_node.next = Node(item)
-                current_node = current_node.next
+            last.next = prev.next
+            prev.next = first
+
+        if last.next is None:
+            self.last = last
+        self._length += length
+        self._digest = None
     
  
     def is_empty(self):
@@ -51,32 +304,47 @@ class LinkedList:
         """ (LinkedList) -> int
         Return the number of elements in this list.
         """
-        curr = self.first
-        size = 0
-        while curr is not None:
-            size = size + 1
-            curr = curr.next
-        return size
+        return self._length
+
+
+    def _nodes_in(self, positions):
+        """ (LinkedList, range) -> generator
+
+        Precondition: positions is a non-empty range of valid positions
+        in this list, with a positive step.
+
+        Yield the nodes at positions, walking the list only once.
+        """
+        curr = self._node_before(positions.start + 1)
+        yield curr
+        for i in range(len(positions) - 1):
+            for j in range(positions.step):
+                curr = curr.next
+            yield curr
 
 
     def __getitem__(self, index):
-        """ (LinkedList, int) -> object
+        """ (LinkedList, int or slice) -> object
 
         Return the item at position index in this list.
+        If index is a slice, return a new list of the items in it.
         Raise IndexError if index is >= the length of self.
         """
-        #if len(self) <= index:
-        #    raise IndexError
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            if len(positions) == 0:
+                return self._from_items(())
+            elif positions.step > 0:
+                return self._from_items(node.item for node in
+                                        self._nodes_in(positions))
+            else:
+                items = [node.item for node in self._nodes_in(positions[::-1])]
+                items.reverse()
+                return self._from_items(items)
 
-        curr = self.first
+        index = self._check_index(index)
         # Iterate to (index)-th node
-        try:
-            for i in range(index):
-                curr = curr.next
-            return curr.item
-        
-        except AttributeError:
-            raise IndexError
+        return self._node_before(index + 1).item
 
 
     def remove(self, index):
@@ -88,16 +356,8 @@ class LinkedList:
         if len(self) <= index:
             raise IndexError
 
-        if index == 0:
-            self.first = self.first.next
-        else:
-            # Iterate to (index-1)-th node
-            curr = self.first
-            for i in range(index - 1):
-                curr = curr.next
-
-            # Update link to skip over i-th node
-            curr.next = curr.next.next
+        # Update link to skip over i-th node
+        self._remove_after(self._node_before(index))
 
             
     def removeB(self, index):
@@ -110,7 +370,7 @@ class LinkedList:
         try:
             curr = self.first
             if index == 0:
-                self.first = self.first.next
+                self._remove_after(None)
             
             else:
             
@@ -118,7 +378,9 @@ class LinkedList:
                 for i in range(index - 1):
                     curr = curr.next
                 
-                curr.next = curr.next.next
+                if curr.next is None:
+                    raise IndexError
+                self._remove_after(curr)
             
         except AttributeError:
             raise IndexError
@@ -135,20 +397,10 @@ class LinkedList:
             raise IndexError
 
         # Create new node
-        new_node = Node(item)
-
-        if index == 0:
-            new_node.next = self.first
-            self.first = new_node
-        else:
-            # Iterate to (index-1)-th node
-            curr = self.first
-            for i in range(index - 1):
-                curr = curr.next
+        new_node = self._make_node(item)
 
-            # Update links to insert new node
-            new_node.next = curr.next
-            curr.next = new_node
+        # Update links to insert new node
+        self._insert_after(self._node_before(index), new_node)
             
 
     def insertB(self, index, item):
@@ -162,20 +414,20 @@ class LinkedList:
         try:
         # Create new node
             curr = self.first
-            new_node = Node(item)
+            new_node = self._make_node(item)
 
             if index == 0:
-                new_node.next = self.first
-                self.first = new_node
+                self._insert_after(None, new_node)
             else:
                 # Iterate to (index-1)-th node
 
                 for i in range(index - 1):
                     curr = curr.next
     
+                if curr is None:
+                    raise IndexError
                 # Update links to insert new node
-                new_node.next = curr.next
-                curr.next = new_node
+                self._insert_after(curr, new_node)
         except AttributeError:
             raise IndexError
 
@@ -212,41 +464,117 @@ class LinkedList:
         >>> str(LinkedList([1, 2, 3]))
         '[1 -> 2 -> 3]'
         """
-        string_to_return = "["
+        return "[" + " -> ".join(map(str, self)) + "]"
+
+
+    def __iter__(self):
+        """ (LinkedList) -> generator
+        Yield the items in this list from first to last.
+        """
         curr = self.first
-        
         while curr is not None:
-            if curr.next is not None:
-                string_to_return += str(curr.item) + " -> " 
-            else:
-                string_to_return += str(curr.item)
+            yield curr.item
+            curr = curr.next
+
+
+    def enumerate_nodes(self):
+        """ (LinkedList) -> generator
+
+        Yield (index, node) for every node in this list, in order.
+        The nodes are for reading: change items through __setitem__,
+        which also forgets the cached digest.
+        """
+        index = 0
+        curr = self.first
+        while curr is not None:
+            yield index, curr
+            index += 1
             curr = curr.next
-            
-        return string_to_return + "]"
     
 
     def __setitem__(self, index, new_item):
-        """ (LinkedList, int, object) -> NoneType
+        """ (LinkedList, int or slice, object) -> NoneType
 
         Store item at position index in self.
+        If index is a slice, new_item is an iterable of items to replace
+        the ones in the slice, following the rules for Python lists.
         Raise IndexError if index is >= the length of self.
         >>> lst = LinkedList([1, 2, 3])
         >>> lst[1] = 100
         >>> str(lst)
         '[1 -> 100 -> 3]'
         """
+        if not isinstance(index, slice):
+            index = self._check_index(index)
+            self._set_item(self._node_before(index + 1), new_item)
+            return
+
+        positions = range(*index.indices(len(self)))
+        # new_item may be reading this very list, so read it all first
+        items = list(new_item)
+
+        if index.step is None or index.step == 1:
+            # Replace the slice with however many items new_item has.
+            prev = self._node_before(positions.start)
+            for i in positions:
+                self._remove_after(prev)
+            for item in items:
+                node = self._make_node(item)
+                self._insert_after(prev, node)
+                prev = node
+            return
+
+        if len(items) != len(positions):
+            raise ValueError
+        if len(positions) == 0:
+            return
+        if positions.step < 0:
+            positions = positions[::-1]
+            items.reverse()
+        for node, item in zip(self._nodes_in(positions), items):
+            self._set_item(node, item)
+
+
+    def __delitem__(self, index):
+        """ (LinkedList, int or slice) -> NoneType
+
+        Remove the item at position index, or every item in the
+        slice index, in one walk through the list.
+        Raise IndexError if index is >= the length of self.
+        """
+        if not isinstance(index, slice):
+            index = self._check_index(index)
+            self._remove_after(self._node_before(index))
+            return
+
+        positions = range(*index.indices(len(self)))
+        if positions.step < 0:
+            positions = positions[::-1]
+        if len(positions) == 0:
+            return
+
+        prev = self._node_before(positions.start)
+        for i in range(len(positions)):
+            self._remove_after(prev)
+            if i < len(positions) - 1:
+                # Skip over the items kept between two removed ones
+                for j in range(positions.step - 1):
+                    if prev is None:
+                        prev = self.first
+                    else:
+                        prev = prev.next
         
-        try:
-            curr = self.first
-            
-            for i in range(index):
-                curr = curr.next
-            
-            curr.item = new_item
-            
-        except AttributeError:
-            raise IndexError
-        
+
+    def count(self, item):
+        """ (LinkedList, object) -> int
+        Return the number of times item occurs in this list.
+        """
+        total = 0
+        for other in self:
+            if other == item:
+                total += 1
+        return total
+
 
     def delete_item(self, item):
         """ (LinkedList, object) -> NoneType
@@ -259,18 +587,16 @@ class LinkedList:
         '[1 -> 3]'
         """
         
+        prev = None
         curr = self.first
         
-        if self.first.item == item:
-            self.first = self.first.next
-            
-        else:
-            while curr is not None:
-                next_ = curr.next
-                if next_.item == item:
-                    curr.next = curr.next.next
-                else:
-                    curr = curr.next
+        while curr is not None:
+            if curr.item == item:
+                self._remove_after(prev)
+                return
+            else:
+                prev = curr
+                curr = curr.next
 
      
     def map(self, f):
@@ -280,114 +606,1000 @@ class LinkedList:
         applying f to each item in this linked list.
         Note: does not change this linked list.
 
-        >>> list = LinkedList(['Hello', 'Goodbye'])
-        >>> str(list.map(upper))
-        ['HELLO' -> 'GOODBYE']
-        >>> str(list.map(len))
-        [5 -> 7]
+        >>> lst = LinkedList(['Hello', 'Goodbye'])
+        >>> str(lst.map(str.upper))
+        '[HELLO -> GOODBYE]'
+        >>> str(lst.map(len))
+        '[5 -> 7]'
         """
-        llist = LinkedList([])
-        first_node = Node(f(self.first.item))
-        llist.first = first_node
-        
-        ll_curr = llist.first
-        curr = self.first
-        
-        while curr is not None:
-            new_node = Node(f(curr.item))
-            new_node.next = ll_curr.next
-            ll_curr = new_node
-            ll_curr = ll_curr.next
-            curr = curr.next
-            
-        return llist
+        return LinkedList(f(item) for item in self)
+
+
+    def sort(self, key=None, reverse=False):
+        """ (LinkedList, function, bool) -> NoneType
+
+        Sort this list in place, like list.sort: by key(item) if key is
+        given, in descending order if reverse is True, and stably.
+        This is a bottom-up merge sort that relinks the existing nodes,
+        in O(n log n) time, without copying items or recursing.
+        """
+        if len(self) < 2:
+            return
+        if key is None:
+            key = _identity
+
+        head = self.first
+        width = 1
+        while width < len(self):
+            # Merge each pair of neighbouring sorted runs of length width.
+            new_head = None
+            new_tail = None
+            rest = head
+            while rest is not None:
+                left = rest
+                right = _cut_run(left, width)
+                rest = _cut_run(right, width)
+                run_head, run_tail = _merge_runs(left, right, key, reverse)
+                if new_tail is None:
+                    new_head = run_head
+                else:
+                    new_tail.next = run_head
+                new_tail = run_tail
+            head = new_head
+            width *= 2
+
+        self.first = head
+        self.last = new_tail
+        self._digest = None
+
+
+    def lazy(self):
+        """ (LinkedList) -> LinkedListView
+
+        Return a lazy view of this list, on which map, filter and take
+        can be chained without building any intermediate lists.
+
+        >>> lst = LinkedList([1, 2, 3, 4, 5])
+        >>> lst.lazy().map(lambda x: x * x).filter(lambda x: x > 1).take(2).to_list()
+        [4, 9]
+        """
+        return LinkedListView(self)
     
 
     def pop(self):
-        
-        try:
-            curr = self.first
-            
-            if self.first.next is None:
-                thing_to_pop = self.first.item
-                self.first = self.first.next
-                
-                return thing_to_pop
-            
-            else:
-                while curr.next.next is not None:
-                    curr = curr.next
-                
-                    thing_to_pop = curr.next
-                    curr.next = curr.next.next
-                    return thing_to_pop.item 
-            
-        except AttributeError:
+        """ (LinkedList) -> object
+
+        Remove and return the last item in this list.
+        Raise IndexError if this list is empty.
+        """
+        if self.is_empty():
             raise IndexError
         
+        # Still a walk, to find the second-to-last node
+        return self._remove_after(self._node_before(len(self) - 1))
+        
 
     def append(self,item):
-        new_node = Node(item)
-        
-        if self.first == None:
-            self.first = new_node
-            
+        """ (LinkedList, object) -> NoneType
+        Add item to the end of this list.
+        """
+        self._insert_after(self.last, self._make_node(item))
+
+
+    def appendleft(self, item):
+        """ (LinkedList, object) -> NoneType
+        Add item to the front of this list.
+        """
+        self._insert_after(None, self._make_node(item))
+
+
+    def popleft(self):
+        """ (LinkedList) -> object
+
+        Remove and return the first item in this list.
+        Raise IndexError if this list is empty.
+        """
+        if self.is_empty():
+            raise IndexError
         
-        else:
-            curr = self.first
-            while curr.next is not None:
-                curr = curr.next
-                
-            curr.next = new_node
+        return self._remove_after(None)
 
 
     def delete_range(self,low,high):
+        """ (LinkedList, int, int) -> NoneType
+
+        Remove the items at positions low up to but not including high.
+        Raise IndexError unless 0 <= low <= high <= the length of self.
+        """
+        if not 0 <= low <= high <= len(self):
+            raise IndexError
         
-        try:
-            curr = self.first
-            
-            if low == 0:
-                for idx in range(high):
-                    curr = curr.next
-                self.first = curr
-                
-            else:
-                low_node = self.first
-                high_node = self.first
-                for idx in range(low):
-                    low_node = low_node.next
-                
-                for idx in range(high):
-                    high_node = high_node.next
-                
-                low_node.next = high_node
-                print(low_node.item)
-                print(high_node.item)
-                
-        except AttributeError:
+        prev = self._node_before(low)
+        for idx in range(high - low):
+            self._remove_after(prev)
+
+
+    def splice(self, other, index):
+        """ (LinkedList, LinkedList, int) -> NoneType
+
+        Move all of the nodes of other into this list, starting at
+        position index, leaving other empty. Once position index is
+        found, this takes O(1) time, whatever the length of other.
+        Raise IndexError if index is > the length of self.
+        """
+        if not 0 <= index <= len(self):
             raise IndexError
+        if other is self:
+            raise ValueError
+
+        if not other.is_empty():
+            self._splice_after(self._node_before(index), other)
         
         
     def __eq__(self,other):
-        
-        try:
-            curr_self = self.first
-            curr_other = other.first
+        """ (LinkedList, object) -> bool
 
-            
-            while (curr_self is not None) and (curr_other is not None):
-                if not (curr_self.item == curr_other.item):
-                    return False
-                
-                else:
-                    curr_self = curr_self.next;
-                    curr_other = curr_other.next;
-                    
-            
-            #if both lists are totally iterated through without returning 
-            #false or throwing an exception, then the lists are equal
-            return (curr_self is None) and (curr_other is None)
-                    
-        except AttributeError:
+        Return True if other is a LinkedList with equal items,
+        in the same order.
+        """
+        if not isinstance(other, LinkedList) or len(self) != len(other):
             return False
-        
+        elif (self._eq_uses_digest and other._eq_uses_digest and
+              self._digest is not None and other._digest is not None and
+              self._digest != other._digest):
+            return False
+
+        for item, other_item in zip(self, other):
+            if not (item == other_item):
+                return False
+        return True
+
+
+    def digest(self):
+        """ (LinkedList) -> int
+
+        Return a hash of the items in this list, in order. It is cached
+        until the list changes, and once both lists have one, == returns
+        False at once when they differ. The items must be hashable.
+        """
+        if self._digest is None:
+            digest = hash(len(self))
+            for item in self:
+                digest = hash((digest, item))
+            self._digest = digest
+        return self._digest
+
+
+    def _json_chunks(self):
+        """ (LinkedList) -> generator
+        Yield the pieces of the JSON array of this list's items, in order.
+        """
+        yield "["
+        for index, node in self.enumerate_nodes():
+            if index > 0:
+                yield ", "
+            yield json.dumps(node.item)
+        yield "]"
+
+
+    def dumps(self):
+        """ (LinkedList) -> str
+
+        Return this list as a JSON array.
+        >>> LinkedList([1, 'a', None]).dumps()
+        '[1, "a", null]'
+        """
+        return "".join(self._json_chunks())
+
+
+    def dump(self, fp):
+        """ (LinkedList, file) -> NoneType
+
+        Write this list as a JSON array to the text file fp, a piece at
+        a time, without building the whole string in memory.
+        """
+        for chunk in self._json_chunks():
+            fp.write(chunk)
+
+
+    @classmethod
+    def loads(cls, s):
+        """ (type, str) -> LinkedList
+        Return a new list of the items in the JSON array s.
+        """
+        return cls(json.loads(s))
+
+
+    @classmethod
+    def load(cls, fp):
+        """ (type, file) -> LinkedList
+        Return a new list of the items in the JSON array in the text file fp.
+        """
+        return cls(json.load(fp))
+
+
+    def to_bytes(self, typecode='d'):
+        """ (LinkedList, str) -> bytes
+
+        Return the items in this list packed as machine values of the
+        given array typecode (e.g. 'l' or 'd'), with no header.
+        """
+        return array(typecode, self).tobytes()
+
+
+    def write_bytes(self, fp, typecode='d'):
+        """ (LinkedList, file, str) -> NoneType
+
+        Write the items in this list to the binary file fp, packed as by
+        to_bytes, a chunk at a time.
+        """
+        items = iter(self)
+        chunk = array(typecode, islice(items, self._CHUNK))
+        while chunk:
+            fp.write(chunk.tobytes())
+            chunk = array(typecode, islice(items, self._CHUNK))
+
+
+    @classmethod
+    def from_bytes(cls, data, typecode='d'):
+        """ (type, bytes, str) -> LinkedList
+        Return a new list of the items packed in data by to_bytes.
+        """
+        items = array(typecode)
+        items.frombytes(data)
+        return cls(items)
+
+
+    @classmethod
+    def read_bytes(cls, fp, typecode='d'):
+        """ (type, file, str) -> LinkedList
+
+        Return a new list of the items written to the binary file fp by
+        write_bytes, reading a chunk at a time.
+        """
+        lst = cls()
+        item_size = array(typecode).itemsize
+        leftover = b""
+        data = fp.read(cls._CHUNK * item_size)
+        while data:
+            data = leftover + data
+            usable = len(data) - len(data) % item_size
+            chunk = array(typecode)
+            chunk.frombytes(data[:usable])
+            lst.extend(chunk)
+            leftover = data[usable:]
+            data = fp.read(cls._CHUNK * item_size)
+
+        if leftover:
+            raise ValueError
+        return lst
+
+
+class LinkedListView:
+    """A lazy, chainable view of the items of a LinkedList.
+
+    map, filter and take each return a new view with one more stage,
+    and do no work. Iterating over a view runs all of its stages on
+    each item in turn, in a single walk of the source list, and stops
+    as soon as a take stage has taken all it needs.
+
+    Attributes:
+    - source (iterable): the list the items come from
+    """
+
+    _MAP, _FILTER, _TAKE = range(3)
+    _NO_INITIAL = object()
+
+    def __init__(self, source, stages=()):
+        """ (LinkedListView, iterable, tuple) -> NoneType
+
+        Create a view of the items in source, transformed by stages,
+        a tuple of (kind, argument) pairs.
+        """
+        self.source = source
+        self._stages = stages
+
+
+    def map(self, f):
+        """ (LinkedListView, function) -> LinkedListView
+        Return a view with f applied to every item of this view.
+        """
+        return LinkedListView(self.source, self._stages + ((self._MAP, f),))
+
+
+    def filter(self, p):
+        """ (LinkedListView, function) -> LinkedListView
+        Return a view of the items of this view for which p is true.
+        """
+        return LinkedListView(self.source,
+                              self._stages + ((self._FILTER, p),))
+
+
+    def take(self, n):
+        """ (LinkedListView, int) -> LinkedListView
+        Return a view of at most the first n items of this view.
+        """
+        return LinkedListView(self.source, self._stages + ((self._TAKE, n),))
+
+
+    def __iter__(self):
+        """ (LinkedListView) -> generator
+        Yield the items of this view, running every stage on each item.
+        """
+        stages = self._stages
+        taken = [0] * len(stages)
+        for kind, arg in stages:
+            if kind == self._TAKE and arg <= 0:
+                return
+
+        for item in self.source:
+            done = False
+            for i in range(len(stages)):
+                kind, arg = stages[i]
+                if kind == self._MAP:
+                    item = arg(item)
+                elif kind == self._FILTER:
+                    if not arg(item):
+                        break
+                else:
+                    taken[i] += 1
+                    if taken[i] == arg:
+                        # nothing after this item can get past this stage
+                        done = True
+            else:
+                yield item
+
+            if done:
+                return
+
+
+    def reduce(self, f, initial=_NO_INITIAL):
+        """ (LinkedListView, function, object) -> object
+
+        Combine the items of this view from left to right with f,
+        starting from initial if it is given, like functools.reduce.
+        """
+        if initial is self._NO_INITIAL:
+            return reduce(f, self)
+        return reduce(f, self, initial)
+
+
+    def to_list(self):
+        """ (LinkedListView) -> list
+        Return a Python list of the items of this view.
+        """
+        return list(self)
+
+
+    def to_linked_list(self):
+        """ (LinkedListView) -> LinkedList
+        Return a new LinkedList of the items of this view.
+        """
+        return LinkedList(self)
+
+
+class DoublyLinkedList(LinkedList):
+    """A doubly linked list implementation of the List ADT.
+
+    A DoublyLinkedList has the same interface as a LinkedList, but its
+    nodes are DoublyNodes that also point back to the previous node.
+    That makes it a deque: append, appendleft, pop and popleft are all
+    O(1), and so is removing a node given the node itself.
+
+    Attributes:
+    - first (DoublyNode): the first node in the list, or
+                          None if the list is empty
+    - last (DoublyNode): the last node in the list, or
+                         None if the list is empty
+    """
+
+    # append and appendleft hand out nodes whose items callers may change
+    _eq_uses_digest = False
+
+    def _make_node(self, item):
+        """ (DoublyLinkedList, object) -> DoublyNode
+        Return a new, unlinked node storing item.
+        """
+        return DoublyNode(item)
+
+
+    def _node_before(self, index):
+        """ (DoublyLinkedList, int) -> DoublyNode
+
+        Return the node at position index - 1, or None if index is 0.
+        Walks from whichever end of the list is closer.
+        Precondition: 0 <= index <= len(self).
+        """
+        if index <= len(self) // 2:
+            return LinkedList._node_before(self, index)
+
+        curr = self.last
+        for i in range(len(self) - index):
+            curr = curr.prev
+        return curr
+
+
+    def _insert_after(self, prev, new_node):
+        """ (DoublyLinkedList, DoublyNode, DoublyNode) -> NoneType
+
+        Link new_node into this list right after prev,
+        or at the front of the list if prev is None.
+        """
+        LinkedList._insert_after(self, prev, new_node)
+        new_node.prev = prev
+        if new_node.next is not None:
+            new_node.next.prev = new_node
+
+
+    def _remove_after(self, prev):
+        """ (DoublyLinkedList, DoublyNode) -> object
+
+        Unlink the node right after prev, or the first node if prev
+        is None, and return its item.
+        Raise AttributeError, without changing the list, if there
+        is no such node.
+        """
+        if prev is None:
+            node = self.first
+        else:
+            node = prev.next
+
+        item = LinkedList._remove_after(self, prev)
+        if node.next is not None:
+            node.next.prev = prev
+        node.prev = None
+        node.next = None
+        return item
+
+
+    def append(self, item):
+        """ (DoublyLinkedList, object) -> DoublyNode
+
+        Add item to the end of this list.
+        Return the new node, which can be passed to remove_node.
+        """
+        new_node = self._make_node(item)
+        self._insert_after(self.last, new_node)
+        return new_node
+
+
+    def appendleft(self, item):
+        """ (DoublyLinkedList, object) -> DoublyNode
+
+        Add item to the front of this list.
+        Return the new node, which can be passed to remove_node.
+        """
+        new_node = self._make_node(item)
+        self._insert_after(None, new_node)
+        return new_node
+
+
+    def _splice_after(self, prev, other):
+        """ (DoublyLinkedList, DoublyNode, DoublyLinkedList) -> NoneType
+
+        Precondition: other is not empty.
+
+        Link all of the nodes of other into this list right after prev,
+        or at the front of the list if prev is None, and empty other.
+        Raise TypeError if other is not a DoublyLinkedList.
+        """
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError
+
+        first, last = other.first, other.last
+        LinkedList._splice_after(self, prev, other)
+        first.prev = prev
+        if last.next is not None:
+            last.next.prev = last
+
+
+    def sort(self, key=None, reverse=False):
+        """ (DoublyLinkedList, function, bool) -> NoneType
+
+        Sort this list in place, like list.sort, by relinking its nodes.
+        """
+        LinkedList.sort(self, key, reverse)
+
+        prev = None
+        curr = self.first
+        while curr is not None:
+            curr.prev = prev
+            prev = curr
+            curr = curr.next
+
+
+    def pop(self):
+        """ (DoublyLinkedList) -> object
+
+        Remove and return the last item in this list.
+        Raise IndexError if this list is empty.
+        """
+        if self.is_empty():
+            raise IndexError
+
+        return self._remove_after(self.last.prev)
+
+
+    def remove_node(self, node):
+        """ (DoublyLinkedList, DoublyNode) -> object
+
+        Precondition: node is in this list.
+
+        Remove node from this list, and return its item.
+        """
+        return self._remove_after(node.prev)
+
+
+    def __reversed__(self):
+        """ (DoublyLinkedList) -> generator
+        Yield the items in this list from last to first.
+        """
+        curr = self.last
+        while curr is not None:
+            yield curr.item
+            curr = curr.prev
+
+
+class NodePool:
+    """A free list of unused Nodes, for reuse by PooledLinkedLists.
+
+    Released nodes are chained together through their next attributes,
+    so keeping them costs no memory beyond the nodes themselves.
+
+    Attributes:
+    - max_size (int): the most nodes kept for reuse, or None for no limit
+    """
+
+    def __init__(self, size=0, max_size=None):
+        """ (NodePool, int, int) -> NoneType
+
+        Create a new pool, preallocating size nodes.
+        """
+        self.max_size = max_size
+        self._free = None    # first node of the free list
+        self._free_count = 0
+        for i in range(size):
+            self.release(Node(None))
+
+
+    def __len__(self):
+        """ (NodePool) -> int
+        Return the number of nodes available for reuse.
+        """
+        return self._free_count
+
+
+    def acquire(self, item):
+        """ (NodePool, object) -> Node
+
+        Return an unlinked node storing item, reusing a released node
+        if there is one.
+        """
+        node = self._free
+        if node is None:
+            return Node(item)
+
+        self._free = node.next
+        self._free_count -= 1
+        node.item = item
+        node.next = None
+        return node
+
+
+    def release(self, node):
+        """ (NodePool, Node) -> NoneType
+
+        Precondition: node is no longer linked into any list.
+
+        Keep node for reuse by acquire, unless the pool is full.
+        """
+        node.item = None    # don't keep the item alive
+        if self.max_size is None or self._free_count < self.max_size:
+            node.next = self._free
+            self._free = node
+            self._free_count += 1
+
+
+class PooledLinkedList(LinkedList):
+    """A LinkedList that recycles its nodes through a NodePool.
+
+    Nodes removed from the list are released to the pool, and new nodes
+    are acquired from it, so once the pool holds enough nodes, a steady
+    mix of insertions and removals allocates no new objects.
+    Several lists can share one pool.
+
+    Attributes:
+    - first (Node): the first node in the list, or
+                    None if the list is empty
+    - last (Node): the last node in the list, or
+                   None if the list is empty
+    - pool (NodePool): where nodes come from and go back to
+    """
+
+    def __init__(self, items=(), pool=None):
+        """ (PooledLinkedList, iterable, NodePool) -> NoneType
+
+        Create a list of the items in items, taking nodes from pool,
+        or from a new pool of its own if pool is None.
+        """
+        if pool is None:
+            pool = NodePool()
+        self.pool = pool
+        LinkedList.__init__(self, items)
+
+
+    def _make_node(self, item):
+        """ (PooledLinkedList, object) -> Node
+        Return an unlinked node storing item, taken from the pool.
+        """
+        return self.pool.acquire(item)
+
+
+    def _from_items(self, items):
+        """ (PooledLinkedList, iterable) -> PooledLinkedList
+        Return a new list of the items in items, sharing this list's pool.
+        """
+        return PooledLinkedList(items, self.pool)
+
+
+    def _remove_after(self, prev):
+        """ (PooledLinkedList, Node) -> object
+
+        Unlink the node right after prev, or the first node if prev
+        is None, release it to the pool, and return its item.
+        Raise AttributeError, without changing the list, if there
+        is no such node.
+        """
+        if prev is None:
+            node = self.first
+        else:
+            node = prev.next
+
+        item = LinkedList._remove_after(self, prev)
+        self.pool.release(node)
+        return item
+
+
+class IndexedLinkedList(LinkedList):
+    """A LinkedList that keeps a count of each of its items in a dict.
+
+    Every method that adds, removes or replaces items keeps the counts
+    up to date, which makes membership tests and count O(1), and lets
+    delete_item give up at once when the item is missing. The items
+    must be hashable.
+
+    Attributes:
+    - first (Node): the first node in the list, or
+                    None if the list is empty
+    - last (Node): the last node in the list, or
+                   None if the list is empty
+    """
+
+    def __init__(self, items=()):
+        """ (IndexedLinkedList, iterable) -> NoneType
+
+        Create a list of the hashable items in items, in order.
+        """
+        self._counts = {}
+        LinkedList.__init__(self, items)
+
+
+    def _add_count(self, item, change):
+        """ (IndexedLinkedList, object, int) -> NoneType
+        Add change to the count of item, forgetting it at zero.
+        """
+        total = self._counts.get(item, 0) + change
+        if total == 0:
+            del self._counts[item]
+        else:
+            self._counts[item] = total
+
+
+    def _insert_after(self, prev, new_node):
+        """ (IndexedLinkedList, Node, Node) -> NoneType
+
+        Link new_node into this list right after prev,
+        or at the front of the list if prev is None.
+        """
+        self._add_count(new_node.item, 1)
+        LinkedList._insert_after(self, prev, new_node)
+
+
+    def _remove_after(self, prev):
+        """ (IndexedLinkedList, Node) -> object
+
+        Unlink the node right after prev, or the first node if prev
+        is None, and return its item.
+        Raise AttributeError, without changing the list, if there
+        is no such node.
+        """
+        item = LinkedList._remove_after(self, prev)
+        self._add_count(item, -1)
+        return item
+
+
+    def _set_item(self, node, item):
+        """ (IndexedLinkedList, Node, object) -> NoneType
+        Replace the item stored in node, a node of this list.
+        """
+        self._add_count(item, 1)
+        self._add_count(node.item, -1)
+        LinkedList._set_item(self, node, item)
+
+
+    def _splice_after(self, prev, other):
+        """ (IndexedLinkedList, Node, LinkedList) -> NoneType
+
+        Precondition: other is not empty.
+
+        Link all of the nodes of other into this list right after prev,
+        or at the front of the list if prev is None, and empty other.
+        Takes O(len(other)) time, to count the new items.
+        """
+        for item in other:
+            self._add_count(item, 1)
+        LinkedList._splice_after(self, prev, other)
+
+
+    def _reset(self):
+        """ (IndexedLinkedList) -> NoneType
+        Forget every node of this list, and its counts, leaving it empty.
+        """
+        LinkedList._reset(self)
+        self._counts = {}
+
+
+    def __contains__(self, item):
+        """ (IndexedLinkedList, object) -> bool
+        Return True if item is in this list.
+        """
+        try:
+            return item in self._counts
+        except TypeError:
+            # item is unhashable, but may still equal an item in the list
+            return LinkedList.__contains__(self, item)
+
+
+    def count(self, item):
+        """ (IndexedLinkedList, object) -> int
+        Return the number of times item occurs in this list.
+        """
+        try:
+            return self._counts.get(item, 0)
+        except TypeError:
+            return LinkedList.count(self, item)
+
+
+    def delete_item(self, item):
+        """ (IndexedLinkedList, object) -> NoneType
+
+        Remove the FIRST occurrence of item in self.
+        Do nothing if self does not contain item.
+        """
+        if item in self:
+            LinkedList.delete_item(self, item)
+
+
+class SortedLinkedList(LinkedList):
+    """A LinkedList whose items are always in sorted order.
+
+    Items are added with add or extend, which put them in their sorted
+    place, after any equal items. The methods that put an item at a
+    given position, or reorder the list, raise TypeError instead.
+
+    Attributes:
+    - first (Node): the first node in the list, or
+                    None if the list is empty
+    - last (Node): the last node in the list, or
+                   None if the list is empty
+    - key (function): items are sorted by key(item), or by the items
+                      themselves if key is None
+    """
+
+    def __init__(self, items=(), key=None):
+        """ (SortedLinkedList, iterable, function) -> NoneType
+        Create a sorted list of the items in items.
+        """
+        self.key = key
+        LinkedList.__init__(self, items)
+
+
+    def _key(self, item):
+        """ (SortedLinkedList, object) -> object
+        Return the value item is sorted by.
+        """
+        if self.key is None:
+            return item
+        return self.key(item)
+
+
+    def _from_items(self, items):
+        """ (SortedLinkedList, iterable) -> LinkedList
+
+        Return a new LinkedList of the items in items.
+        Slices are plain lists, since a reversed slice is not sorted.
+        """
+        return LinkedList(items)
+
+
+    def add(self, item):
+        """ (SortedLinkedList, object) -> NoneType
+
+        Insert item after every item that is <= it.
+        Adding an item that is >= every item takes O(1) time.
+        """
+        key = self._key(item)
+        if self.is_empty() or not key < self._key(self.last.item):
+            prev = self.last
+        else:
+            prev = None
+            curr = self.first
+            while not key < self._key(curr.item):
+                prev = curr
+                curr = curr.next
+        self._insert_after(prev, self._make_node(item))
+
+
+    def extend(self, items):
+        """ (SortedLinkedList, iterable) -> NoneType
+
+        Add every item in items to this list. The new items are sorted
+        on their own, and then merged into this list in one pass.
+        """
+        batch = LinkedList(items)
+        batch.sort(self.key)
+        if batch.is_empty():
+            return
+
+        if self.is_empty():
+            self.first, self.last = batch.first, batch.last
+        else:
+            key = self.key
+            if key is None:
+                key = _identity
+            self.first, self.last = _merge_runs(self.first, batch.first,
+                                                key, False)
+        self._length += len(batch)
+        self._digest = None
+
+
+    def __contains__(self, item):
+        """ (SortedLinkedList, object) -> bool
+
+        Return True if item is in this list.
+        Stops at the first item that sorts after item.
+        """
+        key = self._key(item)
+        for other in self:
+            if key < self._key(other):
+                return False
+            elif item == other:
+                return True
+        return False
+
+
+    def sort(self, key=None, reverse=False):
+        """ (SortedLinkedList, function, bool) -> NoneType
+
+        Do nothing, since this list is always sorted by its own key.
+        Raise TypeError if asked for a different order: a different
+        key, or reverse.
+        """
+        if reverse or (key is not None and key is not self.key):
+            raise TypeError("a SortedLinkedList is always sorted by its "
+                            "own key; copy it to a LinkedList to reorder")
+
+
+    def append(self, item):
+        """ (SortedLinkedList, object) -> NoneType
+        Raise TypeError: use add instead.
+        """
+        raise TypeError("SortedLinkedList.append is not supported; use add")
+
+
+    def appendleft(self, item):
+        """ (SortedLinkedList, object) -> NoneType
+        Raise TypeError: use add instead.
+        """
+        raise TypeError("SortedLinkedList.appendleft is not supported; use add")
+
+
+    def insert(self, index, item):
+        """ (SortedLinkedList, int, object) -> NoneType
+        Raise TypeError: use add instead.
+        """
+        raise TypeError("SortedLinkedList.insert is not supported; use add")
+
+
+    def insertB(self, index, item):
+        """ (SortedLinkedList, int, object) -> NoneType
+        Raise TypeError: use add instead.
+        """
+        raise TypeError("SortedLinkedList.insertB is not supported; use add")
+
+
+    def __setitem__(self, index, new_item):
+        """ (SortedLinkedList, int or slice, object) -> NoneType
+        Raise TypeError: remove items and add new ones instead.
+        """
+        raise TypeError("SortedLinkedList items cannot be assigned; "
+                        "delete them and add new ones")
+
+
+    def splice(self, other, index):
+        """ (SortedLinkedList, LinkedList, int) -> NoneType
+        Raise TypeError: use extend instead.
+        """
+        raise TypeError("SortedLinkedList.splice is not supported; use extend")
+
+
+def merge_sorted(*lists, key=None):
+    """ (iterables, function) -> LinkedList
+
+    Precondition: every list in lists is sorted (by key, if given).
+
+    Return a new LinkedList of the items in all of lists, in sorted
+    order. A heap holds the next item of each list, so the lists are
+    read one item at a time, and merging n items from k lists takes
+    O(n log k) time. Equal items keep the order of the lists they
+    came from.
+    """
+    return LinkedList(merge(*lists, key=key))
+
+
+def _identity(item):
+    """ (object) -> object
+    Return item. The default sort key.
+    """
+    return item
+
+
+def _cut_run(node, n):
+    """ (Node, int) -> Node
+
+    Cut the chain of nodes starting at node after its first n nodes,
+    and return the first node of the rest, or None if there is none.
+    """
+    for i in range(n - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge_runs(left, right, key, reverse):
+    """ (Node, Node, function, bool) -> (Node, Node)
+
+    Precondition: the chains of nodes starting at left and right are
+    sorted by key, descending if reverse is True, and end with None.
+
+    Relink the nodes of both chains into one sorted chain, taking from
+    left first when keys are equal, and return its first and last nodes.
+    """
+    head = tail = Node(None)    # placeholder before the first node
+    while left is not None and right is not None:
+        if reverse:
+            take_right = key(left.item) < key(right.item)
+        else:
+            take_right = key(right.item) < key(left.item)
+
+        if take_right:
+            tail.next = right
+            right = right.next
+        else:
+            tail.next = left
+            left = left.next
+        tail = tail.next
+
+    if left is not None:
+        tail.next = left
+    else:
+        tail.next = right
+    while tail.next is not None:
+        tail = tail.next
+    return head.next, tail
@@ -0,0 +1,298 @@
+from LinkedList import LinkedList, ListMixin
+
+
+class ConsNode:
+    """A node in a persistent linked list. Never changed once created.
+
+    Attributes:
+    - item (object): the data stored in this node
+    - next (ConsNode): the next node in the list, or None if this
+                       is the last node
+    - length (int): the number of nodes from this one to the end
+    """
+    __slots__ = ('item', 'next', 'length')
+
+    def __init__(self, item, next=None):
+        """ (ConsNode, object, ConsNode) -> NoneType
+        Create a new node storing item, in front of the nodes from next.
+        """
+        self.item = item
+        self.next = next
+        if next is None:
+            self.length = 1
+        else:
+            self.length = next.length + 1
+
+
+class PersistentLinkedList(ListMixin):
+    """An immutable linked list implementation of the List ADT.
+
+    A PersistentLinkedList is never changed. Instead, prepend, insert,
+    remove, set and map return a new version of the list, which shares
+    every node after the changed position with the old version. Keeping
+    a version around is therefore a free snapshot: no other thread can
+    change it, however many new versions are made from it.
+
+    Attributes:
+    - first (ConsNode): the first node in the list, or
+                        None if the list is empty
+    """
+    __slots__ = ('first',)
+
+    def __init__(self, items=()):
+        """ (PersistentLinkedList, iterable) -> NoneType
+        Create a list of the items in items, in order.
+        """
+        node = None
+        if isinstance(items, PersistentLinkedList):
+            node = items.first
+        else:
+            for item in reversed(list(items)):
+                node = ConsNode(item, node)
+        self.first = node
+
+
+    @classmethod
+    def _from_node(cls, node):
+        """ (type, ConsNode) -> PersistentLinkedList
+        Return a version of the list whose first node is node, or None.
+        """
+        version = cls.__new__(cls)
+        version.first = node
+        return version
+
+
+    def _rebuild(self, items, tail):
+        """ (PersistentLinkedList, list, ConsNode) -> PersistentLinkedList
+
+        Return a new version holding items, in order, followed by
+        the nodes from tail, which are shared rather than copied.
+        """
+        node = tail
+        for item in reversed(items):
+            node = ConsNode(item, node)
+        return self._from_node(node)
+
+
+    def _split(self, index):
+        """ (PersistentLinkedList, int) -> (list, ConsNode)
+
+        Precondition: 0 <= index <= len(self).
+
+        Return the items before position index, and the node at
+        position index (or None).
+        """
+        items = []
+        curr = self.first
+        for i in range(index):
+            items.append(curr.item)
+            curr = curr.next
+        return items, curr
+
+
+    def _node_at(self, index):
+        """ (PersistentLinkedList, int) -> ConsNode
+
+        Precondition: 0 <= index <= len(self).
+
+        Return the node at position index (or None), copying nothing.
+        """
+        curr = self.first
+        for i in range(index):
+            curr = curr.next
+        return curr
+
+
+    def is_empty(self):
+        """ (PersistentLinkedList) -> bool
+        Return True if this list is empty.
+        """
+        return self.first is None
+
+
+    def __len__(self):
+        """ (PersistentLinkedList) -> int
+        Return the number of elements in this list.
+        """
+        if self.first is None:
+            return 0
+        return self.first.length
+
+
+    def __getitem__(self, index):
+        """ (PersistentLinkedList, int or slice) -> object
+
+        Return the item at position index in this list.
+        If index is a slice, return a new version of the items in it;
+        a slice running to the end shares its nodes with this list.
+        Raise IndexError if index is >= the length of self.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1 and stop >= len(self):
+                return self._from_node(self._node_at(min(start, stop)))
+            return PersistentLinkedList(list(self)[index])
+
+        return self._node_at(self._check_index(index)).item
+
+
+    def rest(self):
+        """ (PersistentLinkedList) -> PersistentLinkedList
+
+        Return the version of this list without its first item,
+        in O(1) time.
+        Raise IndexError if this list is empty.
+        """
+        if self.first is None:
+            raise IndexError
+        return self._from_node(self.first.next)
+
+
+    def prepend(self, item):
+        """ (PersistentLinkedList, object) -> PersistentLinkedList
+        Return a new version with item in front of this list, in O(1) time.
+        """
+        return self._from_node(ConsNode(item, self.first))
+
+
+    def insert(self, index, item):
+        """ (PersistentLinkedList, int, object) -> PersistentLinkedList
+
+        Return a new version with item inserted at position index.
+        Only the nodes before index are copied.
+        Raise IndexError if index is > the length of self.
+        Note that adding to the end of a linked list is okay.
+        """
+        if not 0 <= index <= len(self):
+            raise IndexError
+
+        items, tail = self._split(index)
+        items.append(item)
+        return self._rebuild(items, tail)
+
+
+    def append(self, item):
+        """ (PersistentLinkedList, object) -> PersistentLinkedList
+
+        Return a new version with item at the end of this list.
+        Every node is copied, so prefer prepend where possible.
+        """
+        return self.insert(len(self), item)
+
+
+    def remove(self, index):
+        """ (PersistentLinkedList, int) -> PersistentLinkedList
+
+        Return a new version without the item at position index.
+        Only the nodes before index are copied.
+        Raise IndexError if index is >= the length of self.
+        """
+        items, node = self._split(self._check_index(index))
+        return self._rebuild(items, node.next)
+
+
+    def set(self, index, item):
+        """ (PersistentLinkedList, int, object) -> PersistentLinkedList
+
+        Return a new version with item at position index instead.
+        Only the nodes up to index are copied.
+        Raise IndexError if index is >= the length of self.
+        """
+        items, node = self._split(self._check_index(index))
+        items.append(item)
+        return self._rebuild(items, node.next)
+
+
+    def delete_item(self, item):
+        """ (PersistentLinkedList, object) -> PersistentLinkedList
+
+        Return a new version without the FIRST occurrence of item.
+        Return this version if it does not contain item.
+        """
+        items = []
+        curr = self.first
+        while curr is not None:
+            if curr.item == item:
+                return self._rebuild(items, curr.next)
+            items.append(curr.item)
+            curr = curr.next
+        return self
+
+
+    def map(self, f):
+        """ (PersistentLinkedList, function) -> PersistentLinkedList
+
+        Return a new version whose items are obtained by applying f to
+        each item in this list. The longest run of nodes at the end
+        whose items f returns unchanged is shared, not copied.
+        """
+        nodes = []
+        new_items = []
+        curr = self.first
+        while curr is not None:
+            nodes.append(curr)
+            new_items.append(f(curr.item))
+            curr = curr.next
+
+        # find where the unchanged tail starts
+        keep = len(nodes)
+        while keep > 0 and new_items[keep - 1] is nodes[keep - 1].item:
+            keep -= 1
+
+        if keep == len(nodes):
+            return self._rebuild(new_items, None)
+        return self._rebuild(new_items[:keep], nodes[keep])
+
+
+    def __iter__(self):
+        """ (PersistentLinkedList) -> generator
+        Yield the items in this list from first to last.
+        """
+        curr = self.first
+        while curr is not None:
+            yield curr.item
+            curr = curr.next
+
+
+    def to_linked_list(self):
+        """ (PersistentLinkedList) -> LinkedList
+        Return a new, mutable LinkedList of the items in this list.
+        """
+        return LinkedList(self)
+
+
+    def __str__(self):
+        """ (PersistentLinkedList) -> str
+
+        Return a string representation of this list in the form
+        '[item1 -> item2 -> ... -> item-n]'.
+        """
+        return "[" + " -> ".join(map(str, self)) + "]"
+
+
+    def __eq__(self, other):
+        """ (PersistentLinkedList, object) -> bool
+
+        Return True if other is a PersistentLinkedList with equal items,
+        in the same order. Stops early at a tail both versions share.
+        """
+        if (not isinstance(other, PersistentLinkedList) or
+                len(self) != len(other)):
+            return False
+
+        curr, other_curr = self.first, other.first
+        while curr is not other_curr:
+            if not (curr.item == other_curr.item):
+                return False
+            curr, other_curr = curr.next, other_curr.next
+        return True
+
+
+    def __hash__(self):
+        """ (PersistentLinkedList) -> int
+        Return a hash of the items in this list, which must be hashable.
+        """
+        digest = hash(len(self))
+        for item in self:
+            digest = hash((digest, item))
+        return digest
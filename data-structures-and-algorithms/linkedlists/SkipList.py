@@ -0,0 +1,383 @@
+import random
+
+from LinkedList import LinkedListView, ListMixin
+
+
+MAX_LEVEL = 32    # enough for 2 ** 32 items
+
+
+class SkipNode:
+    """A node in a skip list.
+
+    Attributes:
+    - item (object): the data stored in this node
+    - next (list of SkipNode): next[level] is the next node at least
+                               level + 1 lanes high, or None
+    - width (list of int): width[level] is how many positions the link
+                           next[level] skips over, counting the one it
+                           lands on
+    """
+    __slots__ = ('item', 'next', 'width')
+
+    def __init__(self, item, level):
+        """ (SkipNode, object, int) -> NoneType
+        Create a new node storing item, with level lanes, pointing to nothing.
+        """
+        self.item = item
+        self.next = [None] * level
+        self.width = [1] * level
+
+
+class SkipList(ListMixin):
+    """An indexable skip list implementation of the List ADT.
+
+    A SkipList has the same positional interface as a LinkedList,
+    slices included. Its nodes form an ordinary linked list in lane 0, and
+    each node is also in every lane up to a random height, so that
+    higher lanes skip over more and more nodes. Every link records how
+    many positions it skips, so getting, setting, inserting and removing
+    the item at any position takes O(log n) expected time instead of
+    a walk from the front.
+
+    Attributes:
+    - head (SkipNode): a node before the first position, in every lane
+    """
+
+    def __init__(self, items=()):
+        """ (SkipList, iterable) -> NoneType
+        Create a skip list of the items in items, in order.
+        """
+        self.head = SkipNode(None, MAX_LEVEL)
+        self._levels = 1        # number of lanes in use
+        self._length = 0
+        self.extend(items)
+
+
+    def _random_level(self):
+        """ (SkipList) -> int
+        Return a height for a new node: h with probability 1 / 2 ** h.
+        """
+        level = 1
+        while level < MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+
+    def _path(self, index):
+        """ (SkipList, int) -> (list of SkipNode, list of int)
+
+        Precondition: 0 <= index <= len(self).
+
+        Return the last node before position index in each lane in use,
+        and their positions, where the head is at position -1.
+        """
+        nodes = [None] * self._levels
+        positions = [0] * self._levels
+        node = self.head
+        pos = -1
+        for level in range(self._levels - 1, -1, -1):
+            while (node.next[level] is not None and
+                   pos + node.width[level] < index):
+                pos += node.width[level]
+                node = node.next[level]
+            nodes[level] = node
+            positions[level] = pos
+        return nodes, positions
+
+
+    def _node_at(self, index):
+        """ (SkipList, int) -> SkipNode
+
+        Precondition: 0 <= index < len(self).
+
+        Return the node at position index.
+        """
+        node = self.head
+        pos = -1
+        for level in range(self._levels - 1, -1, -1):
+            while (node.next[level] is not None and
+                   pos + node.width[level] <= index):
+                pos += node.width[level]
+                node = node.next[level]
+        return node
+
+
+    def is_empty(self):
+        """ (SkipList) -> bool
+        Return True if this list is empty.
+        """
+        return self._length == 0
+
+
+    def __len__(self):
+        """ (SkipList) -> int
+        Return the number of elements in this list.
+        """
+        return self._length
+
+
+    def __getitem__(self, index):
+        """ (SkipList, int or slice) -> object
+
+        Return the item at position index in this list.
+        If index is a slice, return a new SkipList of the items in it.
+        Raise IndexError if index is >= the length of self.
+        """
+        if isinstance(index, slice):
+            return SkipList(list(self)[index])
+
+        return self._node_at(self._check_index(index)).item
+
+
+    def __setitem__(self, index, new_item):
+        """ (SkipList, int or slice, object) -> NoneType
+
+        Store item at position index in self.
+        If index is a slice, new_item is an iterable of items to replace
+        the ones in the slice, following the rules for Python lists.
+        Raise IndexError if index is >= the length of self.
+        """
+        if not isinstance(index, slice):
+            self._node_at(self._check_index(index)).item = new_item
+            return
+
+        positions = range(*index.indices(self._length))
+        items = list(new_item)
+
+        if index.step is None or index.step == 1:
+            # Replace the slice with however many items new_item has.
+            self.delete_range(positions.start,
+                              positions.start + len(positions))
+            for offset, item in enumerate(items):
+                self.insert(positions.start + offset, item)
+            return
+
+        if len(items) != len(positions):
+            raise ValueError
+        for pos, item in zip(positions, items):
+            self._node_at(pos).item = item
+
+
+    def insert(self, index, item):
+        """ (SkipList, int, object) -> NoneType
+
+        Insert a new node containing item at position index.
+        Raise IndexError if index is > the length of self.
+        Note that adding to the end of a linked list is okay.
+        """
+        if not 0 <= index <= self._length:
+            raise IndexError
+
+        level = self._random_level()
+        while self._levels < level:
+            # A new lane: its only link goes from the head to the end.
+            self.head.next[self._levels] = None
+            self.head.width[self._levels] = self._length + 1
+            self._levels += 1
+
+        nodes, positions = self._path(index)
+        new_node = SkipNode(item, level)
+        for lane in range(self._levels):
+            prev = nodes[lane]
+            if lane < level:
+                # The old link's target moves up to position
+                # positions[lane] + prev.width[lane] + 1.
+                new_node.next[lane] = prev.next[lane]
+                new_node.width[lane] = (positions[lane] + prev.width[lane]
+                                        - index + 1)
+                prev.next[lane] = new_node
+                prev.width[lane] = index - positions[lane]
+            else:
+                # The new node is somewhere under this link.
+                prev.width[lane] += 1
+        self._length += 1
+
+
+    def remove(self, index):
+        """ (SkipList, int) -> NoneType
+
+        Remove node at position index.
+        Raise IndexError if index is >= the length of self.
+        """
+        self._remove_at(self._check_index(index))
+
+
+    def _remove_at(self, index):
+        """ (SkipList, int) -> object
+
+        Precondition: 0 <= index < len(self).
+
+        Remove the node at position index, and return its item.
+        """
+        nodes, positions = self._path(index)
+        target = nodes[0].next[0]
+        for lane in range(self._levels):
+            prev = nodes[lane]
+            if prev.next[lane] is target:
+                prev.width[lane] += target.width[lane] - 1
+                prev.next[lane] = target.next[lane]
+            else:
+                prev.width[lane] -= 1
+
+        while self._levels > 1 and self.head.next[self._levels - 1] is None:
+            self._levels -= 1
+        self._length -= 1
+        return target.item
+
+
+    def __delitem__(self, index):
+        """ (SkipList, int or slice) -> NoneType
+
+        Remove the item at position index, or every item in the slice index.
+        Raise IndexError if index is >= the length of self.
+        """
+        if not isinstance(index, slice):
+            self._remove_at(self._check_index(index))
+            return
+
+        positions = range(*index.indices(self._length))
+        if positions.step > 0:
+            positions = positions[::-1]
+        # From the back, so the positions still to go do not move.
+        for pos in positions:
+            self._remove_at(pos)
+
+
+    def delete_range(self, low, high):
+        """ (SkipList, int, int) -> NoneType
+
+        Remove the items at positions low up to but not including high.
+        Raise IndexError unless 0 <= low <= high <= the length of self.
+        """
+        if not 0 <= low <= high <= self._length:
+            raise IndexError
+
+        for i in range(high - low):
+            self._remove_at(low)
+
+
+    def append(self, item):
+        """ (SkipList, object) -> NoneType
+        Add item to the end of this list.
+        """
+        self.insert(self._length, item)
+
+
+    def appendleft(self, item):
+        """ (SkipList, object) -> NoneType
+        Add item to the front of this list.
+        """
+        self.insert(0, item)
+
+
+    def extend(self, items):
+        """ (SkipList, iterable) -> NoneType
+        Add every item in items to the end of this list, in order.
+        """
+        if items is self:
+            items = list(self)
+        for item in items:
+            self.insert(self._length, item)
+
+
+    def splice(self, other, index):
+        """ (SkipList, SkipList, int) -> NoneType
+
+        Move all of the items of other into this list, starting at
+        position index, leaving other empty.
+        Raise IndexError if index is > the length of self.
+        """
+        if not 0 <= index <= self._length:
+            raise IndexError
+        if other is self:
+            raise ValueError
+
+        items = list(other)
+        other.head = SkipNode(None, MAX_LEVEL)
+        other._levels = 1
+        other._length = 0
+        for offset, item in enumerate(items):
+            self.insert(index + offset, item)
+
+
+    def pop(self):
+        """ (SkipList) -> object
+
+        Remove and return the last item in this list.
+        Raise IndexError if this list is empty.
+        """
+        if self.is_empty():
+            raise IndexError
+        return self._remove_at(self._length - 1)
+
+
+    def popleft(self):
+        """ (SkipList) -> object
+
+        Remove and return the first item in this list.
+        Raise IndexError if this list is empty.
+        """
+        if self.is_empty():
+            raise IndexError
+        return self._remove_at(0)
+
+
+    def delete_item(self, item):
+        """ (SkipList, object) -> NoneType
+
+        Remove the FIRST occurrence of item in self.
+        Do nothing if self does not contain item.
+        """
+        for index, other in enumerate(self):
+            if other == item:
+                self._remove_at(index)
+                return
+
+
+    def count(self, item):
+        """ (SkipList, object) -> int
+        Return the number of times item occurs in this list.
+        """
+        total = 0
+        for other in self:
+            if other == item:
+                total += 1
+        return total
+
+
+    def map(self, f):
+        """ (SkipList, function) -> SkipList
+
+        Return a new SkipList whose items are obtained by applying f to
+        each item in this list.
+        Note: does not change this list.
+        """
+        return SkipList(f(item) for item in self)
+
+
+    def lazy(self):
+        """ (SkipList) -> LinkedListView
+
+        Return a lazy view of this list, on which map, filter and take
+        can be chained without building any intermediate lists.
+        """
+        return LinkedListView(self)
+
+
+    def __iter__(self):
+        """ (SkipList) -> generator
+        Yield the items in this list from first to last.
+        """
+        curr = self.head.next[0]
+        while curr is not None:
+            yield curr.item
+            curr = curr.next[0]
+
+
+    def __str__(self):
+        """ (SkipList) -> str
+
+        Return a string representation of this list in the form
+        '[item1 -> item2 -> ... -> item-n]'.
+        """
+        return "[" + " -> ".join([str(item) for item in self]) + "]"
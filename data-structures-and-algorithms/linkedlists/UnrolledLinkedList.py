@@ -0,0 +1,481 @@
+from array import array
+
+from LinkedList import LinkedListView, ListMixin
+
+
+class Block:
+    """A node in an unrolled linked list, holding several items.
+
+    Attributes:
+    - items (list or array): the items stored in this block, in order
+    - next (Block): the next Block in the list, or None if this
+                    is the last Block
+    """
+    __slots__ = ('items', 'next')
+
+    def __init__(self, items):
+        """ (Block, list or array) -> NoneType
+        Create a new block storing items, pointing to nothing.
+        """
+        self.items = items
+        self.next = None
+
+
+class UnrolledLinkedList(ListMixin):
+    """An unrolled linked list implementation of the List ADT.
+
+    An UnrolledLinkedList has the same positional interface as a
+    LinkedList, slices included, but each node is a Block of up to capacity items
+    kept next to each other in a list, or in an array if a typecode is
+    given. That takes far less memory per item than one Node each, and
+    lets scans, membership tests and str work a block at a time.
+
+    A Block that grows past capacity is split in two, and a Block that
+    shrinks below half of capacity takes items from, or merges with,
+    the next one, so every Block but the last is at least half full.
+
+    Attributes:
+    - first (Block): the first block in the list, or
+                     None if the list is empty
+    - last (Block): the last block in the list, or
+                    None if the list is empty
+    - capacity (int): the most items a block holds
+    - typecode (str): the array typecode blocks store items with,
+                      or None if blocks store items in lists
+    """
+
+    def __init__(self, items=(), capacity=64, typecode=None):
+        """ (UnrolledLinkedList, iterable, int, str) -> NoneType
+
+        Create a list of the items in items, in order, in blocks of up
+        to capacity items. If typecode is given (e.g. 'l' or 'd'), items
+        are stored in arrays of that type instead of lists.
+        """
+        if capacity < 2:
+            raise ValueError
+        self.capacity = capacity
+        self.typecode = typecode
+        self.first = None
+        self.last = None
+        self._length = 0
+        self.extend(items)
+
+
+    def _new_block(self, items=()):
+        """ (UnrolledLinkedList, iterable) -> Block
+        Return a new, unlinked block storing items.
+        """
+        if self.typecode is None:
+            return Block(list(items))
+        return Block(array(self.typecode, items))
+
+
+    def _find(self, index):
+        """ (UnrolledLinkedList, int) -> (Block, Block, int)
+
+        Precondition: 0 <= index < len(self).
+
+        Return the block holding position index, the block before it
+        (or None), and the position of the item within the block.
+        """
+        prev = None
+        block = self.first
+        while index >= len(block.items):
+            index -= len(block.items)
+            prev = block
+            block = block.next
+        return block, prev, index
+
+
+    def _split(self, block):
+        """ (UnrolledLinkedList, Block) -> NoneType
+        Move the second half of the items in block into a new block after it.
+        """
+        half = len(block.items) // 2
+        new_block = self._new_block(block.items[half:])
+        del block.items[half:]
+
+        new_block.next = block.next
+        block.next = new_block
+        if self.last is block:
+            self.last = new_block
+
+
+    def _refill(self, block, prev):
+        """ (UnrolledLinkedList, Block, Block) -> NoneType
+
+        Restore the half-full rule for block, whose previous block is
+        prev (or None), after an item was removed from it.
+        """
+        if len(block.items) >= self.capacity // 2:
+            return
+
+        following = block.next
+        if following is not None:
+            if len(block.items) + len(following.items) <= self.capacity:
+                # merge the next block into this one
+                block.items.extend(following.items)
+                block.next = following.next
+                if self.last is following:
+                    self.last = block
+            else:
+                # take just enough items from the next block
+                count = self.capacity // 2 - len(block.items)
+                block.items.extend(following.items[:count])
+                del following.items[:count]
+
+        elif len(block.items) == 0:
+            # an empty last block: unlink it
+            if prev is None:
+                self.first = None
+            else:
+                prev.next = None
+            self.last = prev
+
+
+    def is_empty(self):
+        """ (UnrolledLinkedList) -> bool
+        Return True if this list is empty.
+        """
+        return self._length == 0
+
+
+    def __len__(self):
+        """ (UnrolledLinkedList) -> int
+        Return the number of elements in this list.
+        """
+        return self._length
+
+
+    def __getitem__(self, index):
+        """ (UnrolledLinkedList, int or slice) -> object
+
+        Return the item at position index in this list.
+        If index is a slice, return a new UnrolledLinkedList of the
+        items in it.
+        Raise IndexError if index is >= the length of self.
+        """
+        if isinstance(index, slice):
+            return UnrolledLinkedList(list(self)[index], self.capacity,
+                                      self.typecode)
+
+        block, prev, offset = self._find(self._check_index(index))
+        return block.items[offset]
+
+
+    def __setitem__(self, index, new_item):
+        """ (UnrolledLinkedList, int or slice, object) -> NoneType
+
+        Store item at position index in self.
+        If index is a slice, new_item is an iterable of items to replace
+        the ones in the slice, following the rules for Python lists.
+        Raise IndexError if index is >= the length of self.
+        """
+        if not isinstance(index, slice):
+            block, prev, offset = self._find(self._check_index(index))
+            block.items[offset] = new_item
+            return
+
+        positions = range(*index.indices(self._length))
+        items = list(new_item)
+
+        if index.step is None or index.step == 1:
+            # Replace the slice with however many items new_item has.
+            self.delete_range(positions.start,
+                              positions.start + len(positions))
+            for offset, item in enumerate(items):
+                self.insert(positions.start + offset, item)
+            return
+
+        if len(items) != len(positions):
+            raise ValueError
+        for pos, item in zip(positions, items):
+            block, prev, offset = self._find(pos)
+            block.items[offset] = item
+
+
+    def insert(self, index, item):
+        """ (UnrolledLinkedList, int, object) -> NoneType
+
+        Insert item at position index.
+        Raise IndexError if index is > the length of self.
+        Note that adding to the end of a linked list is okay.
+        """
+        if not 0 <= index <= self._length:
+            raise IndexError
+
+        if index == self._length:
+            self.append(item)
+            return
+
+        block, prev, offset = self._find(index)
+        block.items.insert(offset, item)
+        self._length += 1
+        if len(block.items) > self.capacity:
+            self._split(block)
+
+
+    def append(self, item):
+        """ (UnrolledLinkedList, object) -> NoneType
+        Add item to the end of this list.
+        """
+        if self.last is None:
+            self.first = self.last = self._new_block()
+        elif len(self.last.items) == self.capacity:
+            # start a new block rather than splitting a full one
+            self.last.next = self._new_block()
+            self.last = self.last.next
+
+        self.last.items.append(item)
+        self._length += 1
+
+
+    def appendleft(self, item):
+        """ (UnrolledLinkedList, object) -> NoneType
+        Add item to the front of this list.
+        """
+        self.insert(0, item)
+
+
+    def extend(self, items):
+        """ (UnrolledLinkedList, iterable) -> NoneType
+        Add every item in items to the end of this list, in order.
+        """
+        if items is self:
+            items = list(self)
+        for item in items:
+            self.append(item)
+
+
+    def __iadd__(self, items):
+        """ (UnrolledLinkedList, iterable) -> UnrolledLinkedList
+        Add every item in items to the end of this list, in order.
+        """
+        self.extend(items)
+        return self
+
+
+    def _remove_at(self, index):
+        """ (UnrolledLinkedList, int) -> object
+
+        Precondition: 0 <= index < len(self).
+
+        Remove the item at position index, and return it.
+        """
+        block, prev, offset = self._find(index)
+        item = block.items.pop(offset)
+        self._length -= 1
+        self._refill(block, prev)
+        return item
+
+
+    def remove(self, index):
+        """ (UnrolledLinkedList, int) -> NoneType
+
+        Remove the item at position index.
+        Raise IndexError if index is >= the length of self.
+        """
+        self._remove_at(self._check_index(index))
+
+
+    def __delitem__(self, index):
+        """ (UnrolledLinkedList, int or slice) -> NoneType
+
+        Remove the item at position index, or every item in the slice index.
+        Raise IndexError if index is >= the length of self.
+        """
+        if not isinstance(index, slice):
+            self._remove_at(self._check_index(index))
+            return
+
+        positions = range(*index.indices(self._length))
+        if positions.step == -1:
+            positions = positions[::-1]
+        if positions.step == 1:
+            self.delete_range(positions.start,
+                              positions.start + len(positions))
+            return
+
+        if positions.step > 0:
+            positions = positions[::-1]
+        # From the back, so the positions still to go do not move.
+        for pos in positions:
+            self._remove_at(pos)
+
+
+    def delete_range(self, low, high):
+        """ (UnrolledLinkedList, int, int) -> NoneType
+
+        Remove the items at positions low up to but not including high,
+        a block at a time.
+        Raise IndexError unless 0 <= low <= high <= the length of self.
+        """
+        if not 0 <= low <= high <= self._length:
+            raise IndexError
+        if low == high:
+            return
+
+        block, prev, offset = self._find(low)
+        remaining = high - low
+        self._length -= remaining
+
+        # Trim the first block, unlink every block the range covers,
+        # then trim the front of the block it ends in.
+        count = min(remaining, len(block.items) - offset)
+        del block.items[offset:offset + count]
+        remaining -= count
+        following = block.next
+        while following is not None and remaining >= len(following.items):
+            remaining -= len(following.items)
+            following = following.next
+
+        block.next = following
+        if following is None:
+            self.last = block
+        else:
+            del following.items[:remaining]
+            self._refill(following, block)
+        self._refill(block, prev)
+
+
+    def splice(self, other, index):
+        """ (UnrolledLinkedList, UnrolledLinkedList, int) -> NoneType
+
+        Move all of the items of other into this list, starting at
+        position index, leaving other empty.
+        Raise IndexError if index is > the length of self.
+        """
+        if not 0 <= index <= self._length:
+            raise IndexError
+        if other is self:
+            raise ValueError
+
+        items = list(other)
+        other.first = other.last = None
+        other._length = 0
+        if index == self._length:
+            self.extend(items)
+            return
+        for offset, item in enumerate(items):
+            self.insert(index + offset, item)
+
+
+    def pop(self):
+        """ (UnrolledLinkedList) -> object
+
+        Remove and return the last item in this list.
+        Raise IndexError if this list is empty.
+        """
+        if self.is_empty():
+            raise IndexError
+
+        item = self.last.items.pop()
+        self._length -= 1
+        if len(self.last.items) == 0:
+            # only now is the block before the last one needed
+            if self.first is self.last:
+                self.first = self.last = None
+            else:
+                prev = self.first
+                while prev.next is not self.last:
+                    prev = prev.next
+                prev.next = None
+                self.last = prev
+        return item
+
+
+    def popleft(self):
+        """ (UnrolledLinkedList) -> object
+
+        Remove and return the first item in this list.
+        Raise IndexError if this list is empty.
+        """
+        if self.is_empty():
+            raise IndexError
+        return self._remove_at(0)
+
+
+    def delete_item(self, item):
+        """ (UnrolledLinkedList, object) -> NoneType
+
+        Remove the FIRST occurrence of item in self.
+        Do nothing if self does not contain item.
+        """
+        prev = None
+        block = self.first
+        while block is not None:
+            if item in block.items:
+                block.items.remove(item)
+                self._length -= 1
+                self._refill(block, prev)
+                return
+            prev = block
+            block = block.next
+
+
+    def count(self, item):
+        """ (UnrolledLinkedList, object) -> int
+        Return the number of times item occurs in this list.
+        """
+        total = 0
+        block = self.first
+        while block is not None:
+            total += block.items.count(item)
+            block = block.next
+        return total
+
+
+    def map(self, f):
+        """ (UnrolledLinkedList, function) -> UnrolledLinkedList
+
+        Return a new UnrolledLinkedList, with the same capacity, whose
+        items are obtained by applying f to each item in this list.
+        Its blocks are lists, since f may return items of any type.
+        Note: does not change this list.
+        """
+        return UnrolledLinkedList((f(item) for item in self), self.capacity)
+
+
+    def lazy(self):
+        """ (UnrolledLinkedList) -> LinkedListView
+
+        Return a lazy view of this list, on which map, filter and take
+        can be chained without building any intermediate lists.
+        """
+        return LinkedListView(self)
+
+
+    def __contains__(self, item):
+        """ (UnrolledLinkedList, object) -> bool
+        Return True if item is in this list.
+        """
+        block = self.first
+        while block is not None:
+            if item in block.items:
+                return True
+            block = block.next
+        return False
+
+
+    def __iter__(self):
+        """ (UnrolledLinkedList) -> generator
+        Yield the items in this list from first to last.
+        """
+        block = self.first
+        while block is not None:
+            yield from block.items
+            block = block.next
+
+
+    def __str__(self):
+        """ (UnrolledLinkedList) -> str
+
+        Return a string representation of this list in the form
+        '[item1 -> item2 -> ... -> item-n]'.
+        """
+        parts = []
+        block = self.first
+        while block is not None:
+            parts.extend(map(str, block.items))
+            block = block.next
+        return "[" + " -> ".join(parts) + "]"
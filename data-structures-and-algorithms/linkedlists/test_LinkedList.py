@@ -0,0 +1,671 @@
+import io
+import random
+import unittest
+
+from LinkedList import (LinkedList, DoublyLinkedList, NodePool,
+                        PooledLinkedList, IndexedLinkedList,
+                        SortedLinkedList, merge_sorted)
+from PersistentLinkedList import PersistentLinkedList
+from SkipList import SkipList
+from UnrolledLinkedList import UnrolledLinkedList
+
+
+SLICES = [slice(None), slice(2, 5), slice(5, 2), slice(-3, None),
+          slice(None, -2), slice(1, None, 2), slice(None, None, 3),
+          slice(6, 1, -2), slice(None, None, -1), slice(20, 30),
+          slice(3, 3)]
+
+
+def check_links(test, lst, items):
+    """ (TestCase, LinkedList, list) -> NoneType
+    Check that lst holds items, and that its last node and length agree.
+    """
+    nodes = []
+    curr = lst.first
+    while curr is not None:
+        nodes.append(curr)
+        curr = curr.next
+    test.assertEqual([node.item for node in nodes], items)
+    test.assertEqual(len(lst), len(items))
+    if nodes:
+        test.assertIs(lst.last, nodes[-1])
+    else:
+        test.assertIsNone(lst.last)
+
+
+class TestLengthAndTail(unittest.TestCase):
+
+    def test_every_change_keeps_last_and_length(self):
+        lst = LinkedList()
+        items = []
+        check_links(self, lst, items)
+        for item in range(5):
+            lst.append(item)
+            items.append(item)
+            check_links(self, lst, items)
+        lst.appendleft(-1)
+        items.insert(0, -1)
+        lst.insert(3, 'a')
+        items.insert(3, 'a')
+        check_links(self, lst, items)
+        self.assertEqual(lst.pop(), items.pop())
+        self.assertEqual(lst.popleft(), items.pop(0))
+        lst.remove(1)
+        del items[1]
+        check_links(self, lst, items)
+        while items:
+            self.assertEqual(lst.pop(), items.pop())
+            check_links(self, lst, items)
+        self.assertRaises(IndexError, lst.pop)
+
+
+class TestDoublyLinkedList(unittest.TestCase):
+
+    def check_prev(self, lst, items):
+        """ (TestDoublyLinkedList, DoublyLinkedList, list) -> NoneType
+        Check the links of lst both ways.
+        """
+        check_links(self, lst, items)
+        prev = None
+        curr = lst.first
+        while curr is not None:
+            self.assertIs(curr.prev, prev)
+            prev, curr = curr, curr.next
+        self.assertEqual(list(reversed(lst)), items[::-1])
+
+
+    def test_deque_operations(self):
+        lst = DoublyLinkedList([2, 3])
+        node = lst.append(4)
+        lst.appendleft(1)
+        self.check_prev(lst, [1, 2, 3, 4])
+        self.assertEqual(lst.remove_node(node), 4)
+        self.check_prev(lst, [1, 2, 3])
+        self.assertEqual(lst.pop(), 3)
+        self.assertEqual(lst.popleft(), 1)
+        self.check_prev(lst, [2])
+        lst.pop()
+        self.check_prev(lst, [])
+
+
+    def test_positions_from_either_end(self):
+        items = list(range(10))
+        lst = DoublyLinkedList(items)
+        for index in range(10):
+            self.assertEqual(lst[index], index)
+        lst.insert(8, 'a')
+        items.insert(8, 'a')
+        del lst[1:9:3]
+        del items[1:9:3]
+        self.check_prev(lst, items)
+
+
+    def test_sort_and_splice_relink_prev(self):
+        lst = DoublyLinkedList([3, 1, 2])
+        lst.sort()
+        self.check_prev(lst, [1, 2, 3])
+        other = DoublyLinkedList([7, 8])
+        lst.splice(other, 1)
+        self.check_prev(lst, [1, 7, 8, 2, 3])
+        self.check_prev(other, [])
+        self.assertRaises(TypeError, lst.splice, LinkedList([9]), 0)
+
+
+class TestBatchConstruction(unittest.TestCase):
+
+    def test_from_any_iterable(self):
+        check_links(self, LinkedList(range(5)), [0, 1, 2, 3, 4])
+        check_links(self, LinkedList(item for item in 'abc'),
+                    ['a', 'b', 'c'])
+        check_links(self, LinkedList(LinkedList([1, 2])), [1, 2])
+        check_links(self, LinkedList(), [])
+
+
+    def test_extend(self):
+        lst = LinkedList([1, 2])
+        lst.extend(iter([3, 4]))
+        lst += (5,)
+        check_links(self, lst, [1, 2, 3, 4, 5])
+        lst.extend(lst)
+        check_links(self, lst, [1, 2, 3, 4, 5] * 2)
+        empty = LinkedList()
+        empty.extend([])
+        check_links(self, empty, [])
+
+
+class TestNodePool(unittest.TestCase):
+
+    def test_removed_nodes_are_reused(self):
+        pool = NodePool()
+        lst = PooledLinkedList([1, 2, 3], pool)
+        node = lst.first
+        lst.popleft()
+        self.assertEqual(len(pool), 1)
+        self.assertIsNone(node.item)
+        lst.append(4)
+        self.assertIs(lst.last, node)
+        self.assertEqual(len(pool), 0)
+        check_links(self, lst, [2, 3, 4])
+
+
+    def test_pool_shared_and_bounded(self):
+        pool = NodePool(size=2, max_size=3)
+        self.assertEqual(len(pool), 2)
+        first = PooledLinkedList([1, 2], pool)
+        second = first[:]
+        self.assertEqual(len(pool), 0)
+        del first[:]
+        del second[:]
+        self.assertEqual(len(pool), 3)
+        check_links(self, first, [])
+        check_links(self, second, [])
+
+
+class TestSlices(unittest.TestCase):
+
+    def test_get_slice(self):
+        items = list(range(8))
+        lst = LinkedList(items)
+        for index in SLICES:
+            with self.subTest(index=index):
+                check_links(self, lst[index], items[index])
+
+
+    def test_delete_slice(self):
+        for index in SLICES:
+            with self.subTest(index=index):
+                items = list(range(8))
+                lst = LinkedList(items)
+                del lst[index]
+                del items[index]
+                check_links(self, lst, items)
+
+
+    def test_assign_slice(self):
+        for index in SLICES:
+            with self.subTest(index=index):
+                items = list(range(8))
+                lst = LinkedList(items)
+                size = len(range(*index.indices(8)))
+                if index.step is None:
+                    size += 2    # contiguous slices may change length
+                new_items = ['x%d' % i for i in range(size)]
+                lst[index] = iter(new_items)
+                items[index] = new_items
+                check_links(self, lst, items)
+
+
+    def test_extended_slice_needs_same_length(self):
+        lst = LinkedList(range(8))
+        with self.assertRaises(ValueError):
+            lst[::2] = [1, 2]
+        check_links(self, lst, list(range(8)))
+
+
+    def test_assign_from_itself(self):
+        lst = LinkedList([1, 2, 3])
+        lst[3:3] = iter(lst)
+        check_links(self, lst, [1, 2, 3, 1, 2, 3])
+        lst = LinkedList([1, 2, 3])
+        lst[len(lst):] = lst.lazy()
+        check_links(self, lst, [1, 2, 3, 1, 2, 3])
+        lst = LinkedList([1, 2, 3])
+        lst[::-1] = lst
+        check_links(self, lst, [3, 2, 1])
+
+
+    def test_delete_range_and_splice(self):
+        lst = LinkedList(range(6))
+        lst.delete_range(1, 4)
+        check_links(self, lst, [0, 4, 5])
+        self.assertRaises(IndexError, lst.delete_range, 2, 4)
+        other = LinkedList(['a', 'b'])
+        lst.splice(other, 3)
+        check_links(self, lst, [0, 4, 5, 'a', 'b'])
+        check_links(self, other, [])
+        self.assertRaises(ValueError, lst.splice, lst, 0)
+
+
+class TestIteration(unittest.TestCase):
+
+    def test_iter_and_reversed(self):
+        lst = LinkedList('abc')
+        self.assertEqual(list(lst), ['a', 'b', 'c'])
+        self.assertEqual(list(reversed(lst)), ['c', 'b', 'a'])
+        self.assertEqual(list(LinkedList()), [])
+
+
+    def test_enumerate_nodes(self):
+        lst = LinkedList('abc')
+        pairs = [(index, node.item) for index, node in lst.enumerate_nodes()]
+        self.assertEqual(pairs, [(0, 'a'), (1, 'b'), (2, 'c')])
+
+
+    def test_map_and_membership(self):
+        lst = LinkedList(['Hello', 'Goodbye'])
+        check_links(self, lst.map(str.upper), ['HELLO', 'GOODBYE'])
+        check_links(self, lst, ['Hello', 'Goodbye'])
+        self.assertIn('Hello', lst)
+        self.assertNotIn('hello', lst)
+        self.assertEqual(lst.count('Hello'), 1)
+
+
+class TestLazyView(unittest.TestCase):
+
+    def test_chained_stages(self):
+        lst = LinkedList(range(10))
+        view = lst.lazy().map(lambda x: x * x).filter(lambda x: x % 2 == 0)
+        self.assertEqual(view.to_list(), [0, 4, 16, 36, 64])
+        self.assertEqual(view.take(2).to_list(), [0, 4])
+        check_links(self, view.to_linked_list(), [0, 4, 16, 36, 64])
+        self.assertEqual(view.reduce(lambda x, y: x + y), 120)
+        self.assertEqual(lst.lazy().take(0).reduce(max, -1), -1)
+
+
+    def test_views_do_no_work_until_read(self):
+        seen = []
+
+        def record(item):
+            seen.append(item)
+            return item
+
+        view = LinkedList(range(100)).lazy().map(record).take(3)
+        self.assertEqual(seen, [])
+        self.assertEqual(view.to_list(), [0, 1, 2])
+        self.assertEqual(seen, [0, 1, 2])
+
+
+    def test_view_sees_later_changes(self):
+        lst = LinkedList([1, 2])
+        view = lst.lazy().map(str)
+        lst.append(3)
+        self.assertEqual(view.to_list(), ['1', '2', '3'])
+
+
+class TestSkipList(unittest.TestCase):
+
+    def check_widths(self, lst, items):
+        """ (TestSkipList, SkipList, list) -> NoneType
+
+        Check that lst holds items, and that in every lane each link's
+        width takes it to the right position.
+        """
+        self.assertEqual(list(lst), items)
+        self.assertEqual(len(lst), len(items))
+        for lane in range(lst._levels):
+            node = lst.head
+            pos = -1
+            while node.next[lane] is not None:
+                pos += node.width[lane]
+                node = node.next[lane]
+                self.assertIs(node.item, items[pos])
+            self.assertEqual(pos + node.width[lane], len(items))
+
+
+    def test_random_changes(self):
+        rng = random.Random(14)
+        items = []
+        lst = SkipList()
+        for step in range(400):
+            choice = rng.randrange(4)
+            if choice < 2 or not items:
+                index = rng.randint(0, len(items))
+                item = object()
+                lst.insert(index, item)
+                items.insert(index, item)
+            elif choice == 2:
+                index = rng.randrange(len(items))
+                del lst[index]
+                del items[index]
+            else:
+                index = rng.randrange(len(items))
+                lst[index] = item = object()
+                items[index] = item
+            self.check_widths(lst, items)
+        for index in range(len(items)):
+            self.assertIs(lst[index], items[index])
+
+
+    def test_slices(self):
+        for index in SLICES:
+            with self.subTest(index=index):
+                items = [object() for i in range(8)]
+                lst = SkipList(items)
+                self.assertEqual(list(lst[index]), items[index])
+                del lst[index]
+                del items[index]
+                self.check_widths(lst, items)
+
+                new_items = [object() for i in range(len(items[::2]))]
+                lst[::2] = new_items
+                items[::2] = new_items
+                lst[1:3] = new_items
+                items[1:3] = new_items
+                self.check_widths(lst, items)
+
+
+    def test_list_interface(self):
+        lst = SkipList([1, 2, 3])
+        other = SkipList([7, 8])
+        lst.splice(other, 1)
+        self.assertEqual(list(lst), [1, 7, 8, 2, 3])
+        self.assertTrue(other.is_empty())
+        lst.delete_range(0, 2)
+        self.assertEqual(lst, SkipList([8, 2, 3]))
+        self.assertEqual(list(lst.map(str)), ['8', '2', '3'])
+        self.assertEqual(lst.lazy().filter(lambda x: x > 2).to_list(), [8, 3])
+        self.assertEqual(repr(lst), 'SkipList([8, 2, 3])')
+        self.assertEqual(list(reversed(lst)), [3, 2, 8])
+        self.assertRaises(IndexError, lst.__getitem__, 3)
+
+
+class TestIndexedLinkedList(unittest.TestCase):
+
+    def check_counts(self, lst, items):
+        """ (TestIndexedLinkedList, IndexedLinkedList, list) -> NoneType
+        Check that lst holds items, and that its counts agree with them.
+        """
+        check_links(self, lst, items)
+        counts = {}
+        for item in items:
+            counts[item] = counts.get(item, 0) + 1
+        self.assertEqual(lst._counts, counts)
+        for item in range(-1, 10):
+            self.assertEqual(lst.count(item), items.count(item))
+            self.assertEqual(item in lst, item in items)
+
+
+    def test_counts_follow_every_change(self):
+        items = [1, 2, 2, 3]
+        lst = IndexedLinkedList(items)
+        self.check_counts(lst, items)
+        lst.append(4)
+        lst.insert(0, 2)
+        items = [2, 1, 2, 2, 3, 4]
+        self.check_counts(lst, items)
+        lst[1] = 5
+        items[1] = 5
+        lst.delete_item(2)
+        items.remove(2)
+        lst.delete_item(9)
+        self.check_counts(lst, items)
+        del lst[::2]
+        del items[::2]
+        lst[1:2] = [7, 7]
+        items[1:2] = [7, 7]
+        self.check_counts(lst, items)
+        lst.pop()
+        lst.popleft()
+        self.check_counts(lst, items[1:-1])
+
+
+    def test_counts_after_splice(self):
+        lst = IndexedLinkedList([1, 2])
+        other = IndexedLinkedList([2, 3])
+        lst.splice(other, 1)
+        self.check_counts(lst, [1, 2, 3, 2])
+        self.check_counts(other, [])
+        other.append(3)
+        self.check_counts(other, [3])
+
+        plain = LinkedList([4, 4])
+        lst.splice(plain, 0)
+        self.check_counts(lst, [4, 4, 1, 2, 3, 2])
+        check_links(self, plain, [])
+
+
+class TestSorting(unittest.TestCase):
+
+    def test_sort_is_stable(self):
+        rng = random.Random(16)
+        for size in (0, 1, 2, 7, 100):
+            items = [(rng.randrange(5), i) for i in range(size)]
+            for reverse in (False, True):
+                with self.subTest(size=size, reverse=reverse):
+                    lst = LinkedList(items)
+                    lst.sort(key=lambda pair: pair[0], reverse=reverse)
+                    check_links(self, lst, sorted(items,
+                                                  key=lambda pair: pair[0],
+                                                  reverse=reverse))
+
+
+    def test_sorted_linked_list(self):
+        lst = SortedLinkedList([5, 1, 3])
+        lst.add(2)
+        lst.add(6)
+        lst.extend([4, 0, 3])
+        check_links(self, lst, [0, 1, 2, 3, 3, 4, 5, 6])
+        self.assertIn(4, lst)
+        self.assertNotIn(7, lst)
+        del lst[0]
+        lst.delete_item(3)
+        check_links(self, lst, [1, 2, 3, 4, 5, 6])
+        lst.sort()
+        self.assertRaises(TypeError, lst.sort, reverse=True)
+        for misuse in (lambda: lst.append(0), lambda: lst.appendleft(9),
+                       lambda: lst.insert(0, 9), lambda: lst.__setitem__(0, 9),
+                       lambda: lst.splice(LinkedList([0]), 0)):
+            self.assertRaises(TypeError, misuse)
+        check_links(self, lst, [1, 2, 3, 4, 5, 6])
+
+
+    def test_sorted_by_key(self):
+        lst = SortedLinkedList(['bb', 'a', 'ccc'], key=len)
+        lst.add('dd')
+        check_links(self, lst, ['a', 'bb', 'dd', 'ccc'])
+
+
+    def test_merge_sorted(self):
+        merged = merge_sorted([1, 4, 7], LinkedList([2, 5]), [3, 6, 8])
+        check_links(self, merged, list(range(1, 9)))
+        check_links(self, merge_sorted(), [])
+
+
+class TestUnrolledLinkedList(unittest.TestCase):
+
+    def check_blocks(self, lst, items):
+        """ (TestUnrolledLinkedList, UnrolledLinkedList, list) -> NoneType
+
+        Check that lst holds items, and that every block is within
+        capacity and, except the last, at least half full.
+        """
+        self.assertEqual(list(lst), items)
+        self.assertEqual(len(lst), len(items))
+        prev = None
+        block = lst.first
+        while block is not None:
+            self.assertTrue(0 < len(block.items) <= lst.capacity)
+            if block.next is not None:
+                self.assertGreaterEqual(len(block.items), lst.capacity // 2)
+            prev, block = block, block.next
+        self.assertIs(lst.last, prev)
+
+
+    def test_random_changes(self):
+        rng = random.Random(17)
+        for capacity in (2, 3, 4, 8):
+            with self.subTest(capacity=capacity):
+                items = []
+                lst = UnrolledLinkedList(capacity=capacity)
+                for step in range(300):
+                    choice = rng.randrange(5)
+                    if choice < 2 or not items:
+                        index = rng.randint(0, len(items))
+                        lst.insert(index, step)
+                        items.insert(index, step)
+                    elif choice == 2:
+                        index = rng.randrange(len(items))
+                        del lst[index]
+                        del items[index]
+                    elif choice == 3:
+                        self.assertEqual(lst.pop(), items.pop())
+                    else:
+                        lst.delete_item(items[0])
+                        del items[0]
+                    self.check_blocks(lst, items)
+
+
+    def test_slices_and_delete_range(self):
+        for index in SLICES:
+            for capacity in (2, 4):
+                with self.subTest(index=index, capacity=capacity):
+                    items = list(range(20))
+                    lst = UnrolledLinkedList(items, capacity)
+                    del lst[index]
+                    del items[index]
+                    self.check_blocks(lst, items)
+
+                    new_items = ['x%d' % i for i in range(len(items[index]))]
+                    lst[index] = new_items
+                    items[index] = new_items
+                    self.check_blocks(lst, items)
+
+        for low, high in ((0, 20), (3, 17), (0, 1), (5, 5), (19, 20)):
+            with self.subTest(low=low, high=high):
+                items = list(range(20))
+                lst = UnrolledLinkedList(items, 4)
+                lst.delete_range(low, high)
+                del items[low:high]
+                self.check_blocks(lst, items)
+
+
+    def test_typed_blocks_and_list_interface(self):
+        lst = UnrolledLinkedList([1, 2, 3], capacity=2, typecode='l')
+        self.assertEqual(lst.count(2), 1)
+        self.assertRaises(TypeError, lst.append, 'x')
+        other = UnrolledLinkedList([7, 8], capacity=2, typecode='l')
+        lst.splice(other, 1)
+        self.check_blocks(lst, [1, 7, 8, 2, 3])
+        self.check_blocks(other, [])
+        self.assertEqual(list(lst.map(str)), ['1', '7', '8', '2', '3'])
+        self.assertEqual(lst.lazy().take(2).to_list(), [1, 7])
+        self.assertEqual(repr(lst), 'UnrolledLinkedList([1, 7, 8, 2, 3])')
+        self.assertEqual(lst, UnrolledLinkedList([1, 7, 8, 2, 3]))
+
+
+class TestSerialization(unittest.TestCase):
+
+    def test_str_and_repr(self):
+        self.assertEqual(str(LinkedList([1, 'a'])), '[1 -> a]')
+        self.assertEqual(str(LinkedList()), '[]')
+        self.assertEqual(repr(LinkedList(['a'])), "LinkedList(['a'])")
+        long_repr = repr(LinkedList(range(100)))
+        self.assertTrue(long_repr.endswith('19, ...])'))
+
+
+    def test_json(self):
+        lst = LinkedList([1, 'a', None, [2, 3]])
+        self.assertEqual(LinkedList.loads(lst.dumps()), lst)
+        stream = io.StringIO()
+        big = LinkedList(range(10000))
+        big.dump(stream)
+        stream.seek(0)
+        self.assertEqual(LinkedList.load(stream), big)
+        self.assertEqual(LinkedList().dumps(), '[]')
+
+
+    def test_bytes(self):
+        lst = LinkedList([1.5, -2.0, 3.25])
+        self.assertEqual(LinkedList.from_bytes(lst.to_bytes()), lst)
+        stream = io.BytesIO()
+        big = LinkedList(range(10000))
+        big.write_bytes(stream, 'l')
+        stream.seek(0)
+        self.assertEqual(LinkedList.read_bytes(stream, 'l'), big)
+
+
+class TestEquality(unittest.TestCase):
+
+    def test_equal_lists(self):
+        self.assertEqual(LinkedList([1, 2]), LinkedList([1, 2]))
+        self.assertEqual(LinkedList([1, 2]), DoublyLinkedList([1, 2]))
+        self.assertNotEqual(LinkedList([1, 2]), LinkedList([1, 2, 3]))
+        self.assertNotEqual(LinkedList([1, 2]), LinkedList([2, 1]))
+        self.assertNotEqual(LinkedList([1, 2]), [1, 2])
+
+
+    def test_digest_follows_changes(self):
+        first = LinkedList(range(100))
+        second = LinkedList(range(100))
+        self.assertEqual(first.digest(), second.digest())
+        second[50] = -1
+        second.digest()
+        self.assertNotEqual(first, second)
+        second[50] = 50
+        self.assertEqual(first, second)
+        self.assertEqual(first.digest(), second.digest())
+
+        changes = [lambda lst: lst.append(1), lambda lst: lst.pop(),
+                   lambda lst: lst.sort(reverse=True),
+                   lambda lst: lst.__delitem__(slice(0, 3)),
+                   lambda lst: lst.splice(LinkedList([5]), 2)]
+        for change in changes:
+            before = first.digest()
+            change(first)
+            first.digest()
+            self.assertNotEqual(first, second)
+            self.assertNotEqual(first.digest(), before)
+            first = LinkedList(range(100))
+            first.digest()
+
+
+    def test_node_changes_in_doubly_linked_list(self):
+        first = DoublyLinkedList([1, 2])
+        node = first.append(3)
+        second = DoublyLinkedList([1, 2, 4])
+        first.digest()
+        second.digest()
+        node.item = 4
+        self.assertEqual(first, second)
+
+
+class TestPersistentLinkedList(unittest.TestCase):
+
+    def test_old_versions_never_change(self):
+        base = PersistentLinkedList([1, 2, 3, 4])
+        versions = [base.prepend(0), base.insert(2, 'a'), base.append(5),
+                    base.remove(1), base.set(3, 'b'), base.delete_item(3),
+                    base.map(lambda item: item * 10), base.rest()]
+        expected = [[0, 1, 2, 3, 4], [1, 2, 'a', 3, 4], [1, 2, 3, 4, 5],
+                    [1, 3, 4], [1, 2, 3, 'b'], [1, 2, 4], [10, 20, 30, 40],
+                    [2, 3, 4]]
+        self.assertEqual(list(base), [1, 2, 3, 4])
+        for version, items in zip(versions, expected):
+            self.assertEqual(list(version), items)
+            self.assertEqual(len(version), len(items))
+
+
+    def test_tails_are_shared(self):
+        base = PersistentLinkedList(range(10))
+        changed = base.set(2, 'x')
+        self.assertIs(changed.first.next.next.next, base.first.next.next.next)
+        self.assertIs(base[4:].first, base.first.next.next.next.next)
+        self.assertIs(base.map(lambda item: item).first, base.first)
+        self.assertIs(base.delete_item('missing'), base)
+
+
+    def test_reads(self):
+        items = list(range(8))
+        lst = PersistentLinkedList(items)
+        for index in range(-8, 8):
+            self.assertEqual(lst[index], items[index])
+        self.assertRaises(IndexError, lst.__getitem__, 8)
+        for index in SLICES:
+            self.assertEqual(list(lst[index]), items[index])
+        self.assertEqual(list(reversed(lst)), items[::-1])
+        self.assertIn(7, lst)
+        self.assertEqual(repr(PersistentLinkedList([1])),
+                         'PersistentLinkedList([1])')
+
+
+    def test_equal_and_hashable(self):
+        first = PersistentLinkedList([1, 2, 3])
+        second = PersistentLinkedList([1, 2, 3])
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, first.set(0, 9))
+        self.assertEqual(len({first, second, first.rest()}), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,8 @@
-class EmptyBSTError:
+from bisect import bisect_left, bisect_right
+from itertools import chain, groupby, repeat
+
+
+class EmptyBSTError(Exception):
     """Exception class used when deleting an item from an empty BST."""
     pass
 
@@ -20,7 +24,27 @@ class BinarySearchTree:
                      if the tree is empty
     - left (BinarySearchTree): the left subtree, or None if the tree is empty
     - right (BinarySearchTree): the right subtree, or None if the tree is empty
+    - height (int): the depth of this tree, or 0 if the tree is empty
+
+    Every node also caches the number of items stored in its tree, its
+    height, and its minimum and maximum items. size, depth, get_min and
+    get_max are then O(1), and select, rank and range run in O(depth).
+
+    Nodes use __slots__ rather than a per-instance __dict__, since a tree
+    with n items is made of 2n + 1 of them. See CompactBinarySearchTree
+    for a much more compact array-backed storage.
+
+    A snapshot shares every node below its root with the tree it was
+    taken from. Such nodes are marked shared, and every method that
+    changes a tree calls _own_children on each node it goes through,
+    which replaces shared subtrees with copies before they change.
     """
+    __slots__ = ('root', 'left', 'right', '_size', 'height', '_min', '_max',
+                 '_shared')
+
+    # True if items equal to a root may also be in its right subtree
+    equal_on_right = False
+
     def __init__(self, root=EmptyValue):
         """ (BinarySearchTree, object) -> NoneType
 
@@ -36,8 +60,205 @@ class BinarySearchTree:
         else:
             # Set left and right to be new empty trees.
             # Note that this is different than setting them to None!
-            self.left = BinarySearchTree()
-            self.right = BinarySearchTree()
+            self.left = self._new_tree()
+            self.right = self._new_tree()
+        self._shared = False    # True if other trees may hold this node
+        self._update()
+
+
+    def _new_tree(self):
+        """ (BinarySearchTree) -> BinarySearchTree
+
+        Return a new empty tree of the same kind as this tree.
+        Subtrees are always created through this method, so that
+        subclasses get subtrees of their own class.
+        """
+        return type(self)()
+
+
+    def _update(self):
+        """ (BinarySearchTree) -> NoneType
+
+        Recompute any data cached on this node from its subtrees.
+        Called on every node whose subtrees may have changed.
+        """
+        if self.is_empty():
+            self._size = 0
+            self.height = 0
+            self._min = EmptyValue
+            self._max = EmptyValue
+        else:
+            left, right = self.left, self.right
+            self._size = left._size + 1 + right._size
+            self.height = 1 + max(left.height, right.height)
+            if left.is_empty():
+                self._min = self.root
+            else:
+                self._min = left._min
+            if right.is_empty():
+                self._max = self.root
+            else:
+                self._max = right._max
+
+
+    def _copy_node(self, tree):
+        """ (BinarySearchTree, BinarySearchTree) -> NoneType
+
+        Store the root value of tree as the root value of this tree,
+        leaving the subtrees alone. Root values are always moved between
+        nodes through this method, so that subclasses can move any data
+        kept with them.
+        """
+        self.root = tree.root
+
+
+    def _own_children(self):
+        """ (BinarySearchTree) -> NoneType
+
+        Replace any subtree of this tree that is shared with a snapshot
+        by a copy of its root node, so that it can be changed. Called on
+        every tree whose subtrees are about to change.
+        """
+        if self.left is not None:
+            if self.left._shared:
+                self.left = self.left._shallow_copy()
+            if self.right._shared:
+                self.right = self.right._shallow_copy()
+
+
+    def _shallow_copy(self):
+        """ (BinarySearchTree) -> BinarySearchTree
+
+        Return a new tree with the root value of this tree and the very
+        same subtrees, which are marked shared.
+        """
+        tree = self._new_tree()
+        tree._copy_node(self)
+        if not self.is_empty():
+            self.left._shared = True
+            self.right._shared = True
+            tree.left = self.left
+            tree.right = self.right
+        tree._update()
+        return tree
+
+
+    def snapshot(self):
+        """ (BinarySearchTree) -> BinarySearchTree
+
+        Return a copy of this tree in O(1) time. The copy shares all of
+        its nodes below the root with this tree, and each of the two
+        trees copies a shared node only when it first changes something
+        under it, so neither ever sees the other's changes.
+
+        >>> bst = BinarySearchTree.from_iterable([1, 2, 3, 4, 5])
+        >>> snap = bst.snapshot()
+        >>> bst.delete(2)
+        >>> snap.insert(6)
+        >>> bst.in_order(), snap.in_order()
+        ([1, 3, 4, 5], [1, 2, 3, 4, 5, 6])
+        """
+        return self._shallow_copy()
+
+
+    def clone(self):
+        """ (BinarySearchTree) -> BinarySearchTree
+
+        Return a copy of this tree that shares no nodes with it, made
+        in one pass over an explicit stack rather than by recursion.
+        """
+        new_tree = self._new_tree()
+        copies = []
+        stack = [(self, new_tree)]
+        while stack:
+            tree, tree_copy = stack.pop()
+            if not tree.is_empty():
+                tree_copy._copy_node(tree)
+                tree_copy.left = self._new_tree()
+                tree_copy.right = self._new_tree()
+                copies.append(tree_copy)
+                stack.append((tree.left, tree_copy.left))
+                stack.append((tree.right, tree_copy.right))
+
+        # every copy comes after its parent, so update from the end
+        for tree_copy in reversed(copies):
+            tree_copy._update()
+        return new_tree
+
+
+    @classmethod
+    def from_iterable(cls, items, presorted=False):
+        """ (type, iterable, bool) -> BinarySearchTree
+
+        Return a new, balanced tree containing every item in items.
+        items is sorted once first, unless presorted is True, in which case
+        it must already be in non-decreasing order. The tree itself is built
+        in O(n) time, without recursion.
+
+        With distinct items the depth is O(log n). In a BinarySearchTree,
+        though, every copy of an item must go in the left subtree of
+        another copy, so a run of k equal items adds up to k to the depth.
+        Use a CountedBinarySearchTree, or an AVLTree, for many duplicates.
+        """
+        if presorted:
+            items = list(items)
+        else:
+            items = sorted(items)
+
+        tree = cls()
+        tree._build(items, 0, len(items))
+        return tree
+
+
+    def _build(self, items, low, high):
+        """ (BinarySearchTree, list, int, int) -> NoneType
+
+        Precondition: this tree is empty and items[low:high] is sorted.
+
+        Fill this tree with a balanced tree of the items in items[low:high],
+        working from an explicit stack of the parts still to be built.
+        """
+        built = []
+        stack = [(self, low, high)]
+        while stack:
+            tree, low, high = stack.pop()
+            if low < high:
+                left_end, right_start = tree._build_root(items, low, high)
+                tree.left = tree._new_tree()
+                tree.right = tree._new_tree()
+                built.append(tree)
+                stack.append((tree.left, low, left_end))
+                stack.append((tree.right, right_start, high))
+
+        # every tree comes after its parent, so update from the end
+        for tree in reversed(built):
+            tree._update()
+
+
+    def _build_root(self, items, low, high):
+        """ (BinarySearchTree, list, int, int) -> (int, int)
+
+        Precondition: this tree is empty and items[low:high] is sorted
+        and not empty.
+
+        Store the item _build puts at the root of items[low:high] in this
+        tree, and return (left_end, right_start): items[low:left_end] go
+        in the left subtree and items[right_start:high] in the right one.
+        """
+        mid = self._root_index(items, low, high)
+        self.root = items[mid]
+        return mid, mid + 1
+
+
+    def _root_index(self, items, low, high):
+        """ (BinarySearchTree, list, int, int) -> int
+
+        Return the index in the sorted items[low:high] of the item that
+        _build should put at the root: the middle one, moved past any
+        duplicates of it, since they must all go in the left subtree.
+        """
+        mid = (low + high) // 2
+        return bisect_right(items, items[mid], mid, high) - 1
 
 
     def is_empty(self):
@@ -120,21 +341,65 @@ class BinarySearchTree:
         Return the number of items in this tree whose value is
         between low and high, inclusive.
         """
-        
-        ###Naive implementation!
-        
-        #if empty, no items in specified range
-        if self.is_empty():
+        if high < low:
             return 0
         
-        #if this item is in range add and recurse
-        elif high >= self.root >= low:
-            return 1 + self.left.range(low,high) + self.right.range(low,high)
-        
-        #if this item is not in range, add and recurse
-        else:
-            return 0 + self.left.range(low,high) + self.right.range(low,high)
-        
+        return self._count_below(high, True) - self._count_below(low, False)
+
+
+    def _count_below(self, item, inclusive):
+        """ (BinarySearchTree, object, bool) -> int
+
+        Return the number of items in this tree that are < item,
+        or <= item if inclusive is True.
+        """
+        total = 0
+        tree = self
+        while not tree.is_empty():
+            if tree.root < item or (inclusive and tree.root == item):
+                # every item in the left subtree is <= tree.root
+                total += tree._size - tree.right._size
+                tree = tree.right
+            else:
+                tree = tree.left
+        return total
+
+
+    def rank(self, item):
+        """ (BinarySearchTree, object) -> int
+
+        Precondition: item can be compared with items in this tree.
+
+        Return the number of items in this tree that are < item.
+        This is the index item has, or would have, in in_order().
+        """
+        return self._count_below(item, False)
+
+
+    def select(self, k):
+        """ (BinarySearchTree, int) -> object
+
+        Return the item at position k of in_order(), i.e. the
+        (k + 1)-th smallest item. A negative k counts from the end.
+        Raise IndexError if k is out of range.
+        """
+        if k < 0:
+            k += self._size
+        if not 0 <= k < self._size:
+            raise IndexError
+
+        tree = self
+        while True:
+            # the items at the root take positions left_size to below - 1
+            below = tree._size - tree.right._size
+            if k < tree.left._size:
+                tree = tree.left
+            elif k < below:
+                return tree.root
+            else:
+                k -= below
+                tree = tree.right
+
 
     def insert(self, item):
         """ (BinarySearchTree, object) -> NoneType
@@ -147,14 +412,17 @@ class BinarySearchTree:
             # Note that self.left and self.right cannot be None if the
             # tree is non-empty! (This is one of our invariants.)
             self.root = item
-            self.left = BinarySearchTree()
-            self.right = BinarySearchTree()
+            self.left = self._new_tree()
+            self.right = self._new_tree()
             
         elif item <= self.root:
+            self._own_children()
             self.left.insert(item)
             
         else:
+            self._own_children()
             self.right.insert(item)
+        self._update()
 
 
     def delete(self, item):
@@ -164,12 +432,297 @@ class BinarySearchTree:
         Do nothing is this tree doesn't contain item.
         """
         if not self.is_empty():
+            self._own_children()
             if self.root == item:
                 self.delete_root()
             elif item < self.root:
                 self.left.delete(item)
             else:
                 self.right.delete(item)
+            self._update()
+
+
+    def insert_many(self, items):
+        """ (BinarySearchTree, iterable) -> NoneType
+
+        Insert every item in items into this tree. The batch is sorted
+        once and taken down the tree in a single pass, split at each node
+        into the part for each subtree; a part that reaches an empty
+        subtree is built there like from_iterable does. Neither step
+        recurses, so any number of duplicates is safe.
+        """
+        keys = sorted(items)
+        touched = []
+        stack = [(self, 0, len(keys))]
+        while stack:
+            tree, low, high = stack.pop()
+            if low >= high:
+                continue
+            elif tree.is_empty():
+                tree._build(keys, low, high)
+            else:
+                left_end, right_start = tree._split_batch(keys, low, high)
+                tree._own_children()
+                touched.append(tree)
+                stack.append((tree.left, low, left_end))
+                stack.append((tree.right, right_start, high))
+
+        # every tree comes after its parent, so update from the end
+        for tree in reversed(touched):
+            tree._update()
+
+
+    def _split_batch(self, keys, low, high):
+        """ (BinarySearchTree, list, int, int) -> (int, int)
+
+        Precondition: this tree is not empty and keys[low:high] is sorted.
+
+        Return (left_end, right_start) such that keys[low:left_end] belong
+        in the left subtree and keys[right_start:high] in the right one.
+        Any keys in between are stored at this node by this call.
+        """
+        mid = bisect_right(keys, self.root, low, high)
+        return mid, mid
+
+
+    def delete_many(self, items):
+        """ (BinarySearchTree, iterable) -> NoneType
+
+        Remove one copy of every item in items from this tree, ignoring
+        any it doesn't contain. The sorted batch is split at each node,
+        and each subtree's part is deleted before its root's copies.
+        """
+        keys = sorted(items)
+        # each entry is (tree, low, high, True) once its subtrees are done
+        stack = [(self, 0, len(keys), False)]
+        while stack:
+            tree, low, high, visited = stack.pop()
+            if low >= high or tree.is_empty():
+                continue
+
+            first = bisect_left(keys, tree.root, low, high)
+            end = bisect_right(keys, tree.root, first, high)
+            if visited:
+                for i in range(first, end):
+                    tree.delete(keys[i])
+                tree._update()
+            else:
+                tree._own_children()
+                stack.append((tree, low, high, True))
+                stack.append((tree.right, end, high, False))
+                stack.append((tree.left, low, first, False))
+
+
+    def contains_many(self, items):
+        """ (BinarySearchTree, iterable) -> list of bool
+
+        Return a list saying, for each item in items in order, whether
+        this tree contains it. The batch is sorted once and split at
+        each node on a single pass down the tree.
+        """
+        items = list(items)
+        order = sorted(range(len(items)), key=items.__getitem__)
+        keys = [items[i] for i in order]
+        found = [False] * len(items)
+
+        stack = [(self, 0, len(keys))]
+        while stack:
+            tree, low, high = stack.pop()
+            if low >= high or tree.is_empty():
+                continue
+
+            first = bisect_left(keys, tree.root, low, high)
+            end = bisect_right(keys, tree.root, first, high)
+            for i in range(first, end):
+                found[order[i]] = True
+            stack.append((tree.left, low, first))
+            stack.append((tree.right, end, high))
+        return found
+
+
+    def split(self, key):
+        """ (BinarySearchTree, object) -> (BinarySearchTree, BinarySearchTree)
+
+        Move the items in this tree that are <= key into one new tree, and
+        the items > key into another, and return both. This tree is left
+        empty. Only the O(depth) nodes on the path to key are relinked.
+        """
+        low = self._new_tree()
+        high = self._new_tree()
+        # the empty trees where the next pieces of low and high go
+        low_hook, high_hook = low, high
+        touched = []
+        tree = self
+        while not tree.is_empty():
+            # the subtrees handed on must not be shared with a snapshot
+            tree._own_children()
+            if tree.root <= key:
+                # tree.root and its left subtree go to low
+                hook = low_hook
+                low_hook = self._new_tree()
+                hook._copy_node(tree)
+                hook.left = tree.left
+                hook.right = low_hook
+                tree = tree.right
+            else:
+                # tree.root and its right subtree go to high
+                hook = high_hook
+                high_hook = self._new_tree()
+                hook._copy_node(tree)
+                hook.left = high_hook
+                hook.right = tree.right
+                tree = tree.left
+            touched.append(hook)
+
+        # every hook comes after its parent, so update from the end
+        for hook in reversed(touched):
+            hook._update()
+        self._clear()
+        return low, high
+
+
+    @classmethod
+    def join(cls, left, right):
+        """ (type, BinarySearchTree, BinarySearchTree) -> BinarySearchTree
+
+        Precondition: left and right are trees of type cls.
+
+        Move every item in left and right into a new tree, and return it,
+        leaving left and right empty. The maximum of left becomes the new
+        root, so this takes O(depth of left) time.
+        Raise ValueError unless every item in left is < every item in right.
+        """
+        if not (left.is_empty() or right.is_empty() or left._max < right._min):
+            raise ValueError
+
+        tree = cls()
+        if left.is_empty():
+            tree._move_from(right)
+        elif right.is_empty():
+            tree._move_from(left)
+        else:
+            tree._copy_node(left._extract_max_node())
+            tree.left = cls()
+            tree.left._move_from(left)
+            tree.right = cls()
+            tree.right._move_from(right)
+            tree._update()
+        return tree
+
+
+    def _move_from(self, tree):
+        """ (BinarySearchTree, BinarySearchTree) -> NoneType
+
+        Precondition: this tree is empty.
+
+        Move all of the nodes of tree into this tree, leaving tree empty.
+        """
+        self._copy_node(tree)
+        self.left = tree.left
+        self.right = tree.right
+        self._update()
+        tree._clear()
+
+
+    def _clear(self):
+        """ (BinarySearchTree) -> NoneType
+        Make this tree empty, without changing its old subtrees.
+        """
+        self._copy_node(self._new_tree())
+        self.left = None
+        self.right = None
+        self._update()
+
+
+    def _extract_max_node(self):
+        """ (BinarySearchTree) -> BinarySearchTree
+
+        Precondition: this tree is not empty.
+
+        Remove the node holding the maximum item, and return a tree
+        holding just its root value (with any data kept with it).
+        """
+        self._own_children()
+        if self.right.is_empty():
+            node = self._new_tree()
+            node._copy_node(self)
+            # Copy left subtree to self, because root node is removed.
+            self._copy_node(self.left)
+            self.right = self.left.right
+            self.left = self.left.left
+        else:
+            node = self.right._extract_max_node()
+        self._update()
+        return node
+
+
+    def _extract_min_node(self):
+        """ (BinarySearchTree) -> BinarySearchTree
+
+        Precondition: this tree is not empty.
+
+        Remove the node holding the minimum item, and return a tree
+        holding just its root value (with any data kept with it).
+        """
+        self._own_children()
+        if self.left.is_empty():
+            node = self._new_tree()
+            node._copy_node(self)
+            # Copy right subtree to self, because root node is removed.
+            self._copy_node(self.right)
+            self.left = self.right.left
+            self.right = self.right.right
+        else:
+            node = self.left._extract_min_node()
+        self._update()
+        return node
+
+
+    def union(self, other):
+        """ (BinarySearchTree, BinarySearchTree) -> BinarySearchTree
+
+        Return a new tree of the items in this tree or other. An item
+        appears as many times as it does in whichever tree has more of
+        it. The two trees are merged as sorted streams, and the result
+        built balanced, in O(m + n) time.
+        """
+        return type(self).from_iterable(
+            _merge_counts(self.iter_counts(), other.iter_counts(), max),
+            presorted=True)
+
+
+    def intersection(self, other):
+        """ (BinarySearchTree, BinarySearchTree) -> BinarySearchTree
+
+        Return a new tree of the items in both this tree and other. An
+        item appears as many times as it does in whichever tree has
+        fewer of it. Takes O(m + n) time.
+        """
+        return type(self).from_iterable(
+            _merge_counts(self.iter_counts(), other.iter_counts(), min),
+            presorted=True)
+
+
+    def difference(self, other):
+        """ (BinarySearchTree, BinarySearchTree) -> BinarySearchTree
+
+        Return a new tree of the items in this tree, with one copy
+        of each item in other taken away. Takes O(m + n) time.
+        """
+        return type(self).from_iterable(
+            _merge_counts(self.iter_counts(), other.iter_counts(),
+                          _subtract),
+            presorted=True)
+
+
+    def iter_counts(self):
+        """ (BinarySearchTree) -> generator
+
+        Yield (item, count) for every distinct item in this tree,
+        in sorted order.
+        """
+        for item, copies in groupby(self.iter_in_order()):
+            yield item, sum(1 for copy in copies)
     
     
     def delete_root(self):
@@ -179,8 +732,9 @@ class BinarySearchTree:
         """
         if self.is_empty():
             raise EmptyBSTError
-        
-        elif self.left.is_empty() and self.right.is_empty():
+
+        self._own_children()
+        if self.left.is_empty() and self.right.is_empty():
             self.root = EmptyValue
             self.left = None
             self.right = None
@@ -189,7 +743,12 @@ class BinarySearchTree:
             self.root = self.left.extract_max()
             
         elif not self.right.is_empty():
-            self.root = self.right.extract_min()
+            # Copy right subtree to self, rather than moving its minimum
+            # up, which would leave any duplicates of it on the right.
+            self._copy_node(self.right)
+            self.left = self.right.left
+            self.right = self.right.right
+        self._update()
 
 
     def extract_max(self):
@@ -200,16 +759,21 @@ class BinarySearchTree:
         """
         if self.is_empty():
             raise EmptyBSTError
-        elif self.right.is_empty():
+
+        self._own_children()
+        if self.right.is_empty():
             temp = self.root
             # Copy left subtree to self, because root node is removed.
             # Note that self = self.left does NOT work!
-            self.root = self.left.root
+            self._copy_node(self.left)
             self.right = self.left.right
             self.left = self.left.left
+            self._update()
             return temp
         else:
-            return self.right.extract_max()
+            temp = self.right.extract_max()
+            self._update()
+            return temp
 
 
     def extract_min(self):
@@ -219,15 +783,20 @@ class BinarySearchTree:
         """
         if self.is_empty():
             raise EmptyBSTError
-        
-        elif self.left.is_empty():
+
+        self._own_children()
+        if self.left.is_empty():
             temp = self.root
-            self.root = self.right.root
+            # Copy right subtree to self, because root node is removed.
+            self._copy_node(self.right)
+            self.left = self.right.left
             self.right = self.right.right
-            self.left = self.left.left
+            self._update()
             return temp
         else:
-            return self.left.extract_min()
+            temp = self.left.extract_min()
+            self._update()
+            return temp
         
 
     def list_range(self, low, high):
@@ -240,42 +809,171 @@ class BinarySearchTree:
         Note: the returned list should include any duplicates
         that appear in this tree.
         """
-        
-        if self.is_empty():
-            return []
-        
-        elif high >= self.root >= low:
-            return self.left.list_range(low, high) + [self.root] + self.right.list_range(low, high)
-        
-        else:
-            return self.left.list_range(low, high) + [] + self.right.list_range(low, high)
-        
+        return list(self.iter_range(low, high))
+
+
+    def iter_range(self, low, high):
+        """ (BinarySearchTree, object, object) -> generator
+
+        Precondition: low and high can be compared with items in this tree.
+
+        Yield the items in this tree whose value is between low and high,
+        inclusive, in sorted order. Subtrees that cannot hold such items
+        are never visited, so this takes O(depth + k) time to yield
+        k items, and stops as soon as an item > high is reached.
+        """
+        for tree in self._range_trees(low, high):
+            yield tree.root
+
+
+    def _range_trees(self, low, high):
+        """ (BinarySearchTree, object, object) -> generator
+
+        Yield, in sorted order, the non-empty trees in this tree whose
+        root value is between low and high, inclusive.
+        """
+        stack = []
+        tree = self
+        while stack or not tree.is_empty():
+            if not tree.is_empty():
+                if tree.root >= low:
+                    # the left subtree may still hold items >= low
+                    stack.append(tree)
+                    tree = tree.left
+                else:
+                    # tree.root and its whole left subtree are < low
+                    tree = tree.right
+            else:
+                tree = stack.pop()
+                if tree.root > high:
+                    # every item after this one is > high too
+                    return
+                yield tree
+                tree = tree.right
+
 
     def pre_order(self):
-        
-        if self.is_empty():
-            return []
-        
-        else:
-            return [self.root] + self.left.pre_order() + self.right.pre_order()
+        """ (BinarySearchTree) -> list
+        Return a list of the items in this tree in pre-order.
+        """
+        return list(self.iter_pre_order())
     
     
     def in_order(self):
-        
-        if self.is_empty():
-            return []
-        
-        else:
-            return  self.left.in_order() + [self.root] + self.right.in_order()
+        """ (BinarySearchTree) -> list
+        Return a sorted list of the items in this tree.
+        """
+        return list(self.iter_in_order())
     
     
     def post_order(self):
-        
-        if self.is_empty():
-            return []
-        
-        else:
-            return  self.left.post_order() + self.right.post_order() + [self.root]
+        """ (BinarySearchTree) -> list
+        Return a list of the items in this tree in post-order.
+        """
+        return list(self.iter_post_order())
+
+
+    def iter_pre_order(self):
+        """ (BinarySearchTree) -> generator
+
+        Yield the items in this tree in pre-order: every root
+        before its left subtree, and the left subtree before the right.
+        Uses an explicit stack of O(depth) trees instead of recursion.
+        """
+        for tree in self._pre_order_trees():
+            yield tree.root
+
+
+    def iter_in_order(self):
+        """ (BinarySearchTree) -> generator
+
+        Yield the items in this tree in sorted order.
+        Uses an explicit stack of O(depth) trees instead of recursion.
+        """
+        for tree in self._in_order_trees():
+            yield tree.root
+
+
+    def iter_post_order(self):
+        """ (BinarySearchTree) -> generator
+
+        Yield the items in this tree in post-order: the left subtree,
+        then the right subtree, then the root.
+        Uses an explicit stack of O(depth) trees instead of recursion.
+        """
+        for tree in self._post_order_trees():
+            yield tree.root
+
+
+    def __iter__(self):
+        """ (BinarySearchTree) -> generator
+        Yield the items in this tree in sorted order.
+        """
+        return self.iter_in_order()
+
+
+    def __reversed__(self):
+        """ (BinarySearchTree) -> generator
+        Yield the items in this tree in reverse sorted order.
+        """
+        for tree in self._in_order_trees(reverse=True):
+            yield tree.root
+
+
+    def _pre_order_trees(self):
+        """ (BinarySearchTree) -> generator
+        Yield the non-empty trees in this tree in pre-order.
+        """
+        stack = [self]
+        while stack:
+            tree = stack.pop()
+            if not tree.is_empty():
+                yield tree
+                # push right first, so that left is visited first
+                stack.append(tree.right)
+                stack.append(tree.left)
+
+
+    def _in_order_trees(self, reverse=False):
+        """ (BinarySearchTree, bool) -> generator
+
+        Yield the non-empty trees in this tree in sorted order of their
+        root values, or in reverse sorted order if reverse is True.
+        """
+        stack = []
+        tree = self
+        while stack or not tree.is_empty():
+            if not tree.is_empty():
+                stack.append(tree)
+                if reverse:
+                    tree = tree.right
+                else:
+                    tree = tree.left
+            else:
+                tree = stack.pop()
+                yield tree
+                if reverse:
+                    tree = tree.left
+                else:
+                    tree = tree.right
+
+
+    def _post_order_trees(self):
+        """ (BinarySearchTree) -> generator
+        Yield the non-empty trees in this tree in post-order.
+        """
+        # each entry is (tree, True) once both subtrees have been yielded
+        stack = [(self, False)]
+        while stack:
+            tree, visited = stack.pop()
+            if tree.is_empty():
+                continue
+            elif visited:
+                yield tree
+            else:
+                stack.append((tree, True))
+                stack.append((tree.right, False))
+                stack.append((tree.left, False))
     
     
     def multiply_leaves(self):
@@ -294,16 +992,20 @@ class BinarySearchTree:
         
         if self.is_empty():
             raise IndexError
-        
-        elif self.left.is_empty():
+
+        self._own_children()
+        if self.left.is_empty():
             temp = self.root
-            self.root = self.right.root
+            self._copy_node(self.right)
             self.left = self.right.left
             self.right = self.right.right
+            self._update()
             return temp
         
         else:
-            self.left.remove_smallest()
+            temp = self.left.remove_smallest()
+            self._update()
+            return temp
             
     
     def list_leaves(self):
@@ -319,56 +1021,89 @@ class BinarySearchTree:
         
     
     def rotate_cc(self):
+        """ (BinarySearchTree) -> NoneType
+
+        Rotate this tree counter-clockwise: the root of the right subtree
+        becomes the new root, and the old root becomes its left child.
+        Precondition: this tree and its right subtree are not empty.
+        """
+        self._own_children()
         
         # copy right
-        temp = BinarySearchTree()
-        temp.root = self.right.root
+        temp = self._new_tree()
+        temp._copy_node(self.right)
         temp.left = self.right.left
         temp.right = self.right.right
         
         # copy self, set right to temp's left tree
-        self_copy = BinarySearchTree()
-        self_copy.root = self.root
+        self_copy = self._new_tree()
+        self_copy._copy_node(self)
         self_copy.left = self.left
         self_copy.right = temp.left
+        self_copy._update()
         
         # set old "self" to be temp's left
         temp.left = self_copy
         
         # set new self to be temp 
-        self.root = temp.root
+        self._copy_node(temp)
         self.right = temp.right
         self.left = temp.left
+        self._update()
 
-       
-    def size(self):
-        
-        if self.is_empty():
-            return 0
-        
-        else:
-            return self.left.size() + 1 + self.right.size()
 
-       
-    def list_duplicates(self):
+    def rotate_cw(self):
+        """ (BinarySearchTree) -> NoneType
+
+        Rotate this tree clockwise: the root of the left subtree
+        becomes the new root, and the old root becomes its right child.
+        Precondition: this tree and its left subtree are not empty.
+        """
+        self._own_children()
         
-        if self.is_empty():
-            return []
+        # copy left
+        temp = self._new_tree()
+        temp._copy_node(self.left)
+        temp.left = self.left.left
+        temp.right = self.left.right
         
-        elif self.left.is_empty() and self.right.is_empty():
-            return []
+        # copy self, set left to temp's right tree
+        self_copy = self._new_tree()
+        self_copy._copy_node(self)
+        self_copy.left = temp.right
+        self_copy.right = self.right
+        self_copy._update()
         
-        elif not self.left.is_empty():
-            left_tree = self.left.in_order()
-            
-            if left_tree[-1] == self.root:
-                return  self.left.list_duplicates() + [self.root] + self.right.list_duplicates()
-            
-            else:
-                return self.left.list_duplicates() + self.right.list_duplicates()
+        # set old "self" to be temp's right
+        temp.right = self_copy
         
-        else:
-            return self.left.list_duplicates() + self.right.list_duplicates()
+        # set new self to be temp
+        self._copy_node(temp)
+        self.left = temp.left
+        self.right = temp.right
+        self._update()
+
+       
+    def size(self):
+        """ (BinarySearchTree) -> int
+        Return the number of items in this tree.
+        """
+        return self._size
+
+       
+    def list_duplicates(self):
+        """ (BinarySearchTree) -> list
+
+        Return a sorted list with every item in this tree once for each
+        extra time it appears, found in one in-order pass.
+        """
+        duplicates = []
+        prev = EmptyValue
+        for item in self.iter_in_order():
+            if prev is not EmptyValue and item == prev:
+                duplicates.append(item)
+            prev = item
+        return duplicates
 
 
     def list_range2(self,low,high):
@@ -382,17 +1117,23 @@ class BinarySearchTree:
             
             else:
                 lst = []
-                
-            return (self.left.list_range2(low,high) + lst +
-                   self.right.list_range2(low,high))
+            
+            # only go into subtrees that can hold items in range
+            if self.root >= low:
+                lst = self.left.list_range2(low,high) + lst
+            if self.root <= high:
+                lst = lst + self.right.list_range2(low,high)
+            return lst
 
 
     def map_f(self,f):
         
         if not self.is_empty():
+            self._own_children()
             self.root = f(self.root)
             self.left.map_f(f)
             self.right.map_f(f)
+            self._update()
 
      
     def multiply_non_leaves(self):
@@ -408,61 +1149,565 @@ class BinarySearchTree:
 
 
     def depth(self):
-        
+        """ (BinarySearchTree) -> int
+        Return the depth of this tree, cached on its root.
+        """
+        return self.height
+
+
+class AVLTree(BinarySearchTree):
+    """Self-balancing Binary Search Tree class.
+
+    An AVLTree has the same interface as a BinarySearchTree, but keeps the
+    heights of the left and right subtrees of every node within one of each
+    other by rotating after each insertion and deletion. Its depth is
+    therefore O(log n), whatever order the items are inserted in.
+
+    Rotations may move an item equal to a root into the right subtree,
+    so an AVLTree only satisfies the weaker property: for every node,
+    its value is >= all items in its left subtree, and <= all items
+    in its right subtree.
+
+    The height cached on every node is used to decide when to rotate.
+    """
+    __slots__ = ()
+
+    equal_on_right = True
+
+    def _root_index(self, items, low, high):
+        """ (AVLTree, list, int, int) -> int
+
+        Return the index of the middle item of items[low:high].
+        Duplicates of the root may go on either side of an AVLTree.
+        """
+        return (low + high) // 2
+
+
+    def _rebalance(self):
+        """ (AVLTree) -> NoneType
+
+        Restore the AVL balance condition at this node, assuming it
+        holds in both subtrees and their heights differ by at most two.
+        """
+        self._update()
+        if self.is_empty():
+            return
+
+        balance = self.left.height - self.right.height
+        if balance > 1 or balance < -1:
+            self._own_children()
+
+        if balance > 1:
+            # left-right case: straighten the left subtree first
+            if self.left.left.height < self.left.right.height:
+                self.left.rotate_cc()
+            self.rotate_cw()
+
+        elif balance < -1:
+            # right-left case: straighten the right subtree first
+            if self.right.right.height < self.right.left.height:
+                self.right.rotate_cw()
+            self.rotate_cc()
+
+
+    def count_all2(self, item):
+        """ (AVLTree, object) -> int
+        Return the number of times item appears in this tree.
+        (Return 0 if this tree is empty.)
+        """
         if self.is_empty():
             return 0
-        
+
+        elif self.root == item:
+            # duplicates of the root may be on either side
+            return 1 + self.left.count_all2(item) + self.right.count_all2(item)
+
+        elif item < self.root:
+            return self.left.count_all2(item)
+
+        else:
+            return self.right.count_all2(item)
+
+
+    def insert(self, item):
+        """ (AVLTree, object) -> NoneType
+
+        Insert item into this tree, then rebalance every tree
+        on the path back up to this one.
+        """
+        BinarySearchTree.insert(self, item)
+        self._rebalance()
+
+
+    def delete(self, item):
+        """ (AVLTree, object) -> NoneType
+
+        Remove item from this tree, then rebalance.
+        Do nothing is this tree doesn't contain item.
+        """
+        BinarySearchTree.delete(self, item)
+        self._rebalance()
+
+
+    def insert_many(self, items):
+        """ (AVLTree, iterable) -> NoneType
+
+        Insert every item in items into this tree. An empty tree is
+        built balanced in one pass; otherwise each item is inserted in
+        turn, so that every node stays balanced.
+        """
+        if self.is_empty():
+            BinarySearchTree.insert_many(self, items)
+        else:
+            for item in items:
+                self.insert(item)
+
+
+    def delete_many(self, items):
+        """ (AVLTree, iterable) -> NoneType
+
+        Remove one copy of every item in items from this tree, one at
+        a time, so that every node stays balanced.
+        """
+        for item in items:
+            self.delete(item)
+
+
+    def split(self, key):
+        """ (AVLTree, object) -> (AVLTree, AVLTree)
+
+        Move the items in this tree that are <= key into one new tree, and
+        the items > key into another, and return both. This tree is left
+        empty. Both trees are rebuilt balanced, in O(n) time.
+        """
+        items = self.in_order()
+        index = bisect_right(items, key)
+        self._clear()
+        return (type(self).from_iterable(items[:index], presorted=True),
+                type(self).from_iterable(items[index:], presorted=True))
+
+
+    @classmethod
+    def join(cls, left, right):
+        """ (type, AVLTree, AVLTree) -> AVLTree
+
+        Move every item in left and right into a new, balanced tree, and
+        return it, leaving left and right empty. Takes O(m + n) time.
+        Raise ValueError unless every item in left is <= every item in right.
+        """
+        if not (left.is_empty() or right.is_empty() or
+                left._max <= right._min):
+            raise ValueError
+
+        tree = cls.from_iterable(chain(left, right), presorted=True)
+        left._clear()
+        right._clear()
+        return tree
+
+
+    def delete_root(self):
+        """ (AVLTree) -> NoneType
+        Remove the root node of this tree, then rebalance.
+        Raise EmptyBSTError if this tree is empty.
+        """
+        BinarySearchTree.delete_root(self)
+        self._rebalance()
+
+
+    def extract_max(self):
+        """ (AVLTree) -> object
+
+        Remove and return the maximum item stored in this tree.
+        Raise EmptyBSTError if this tree is empty.
+        """
+        temp = BinarySearchTree.extract_max(self)
+        self._rebalance()
+        return temp
+
+
+    def extract_min(self):
+        """ (AVLTree) -> object
+        Remove and return the minimum item stored in this tree.
+        Raise EmptyBSTError if this tree is empty.
+        """
+        temp = BinarySearchTree.extract_min(self)
+        self._rebalance()
+        return temp
+
+
+    def remove_smallest(self):
+        """ (AVLTree) -> object
+        Remove and return the minimum item stored in this tree.
+        Raise IndexError if this tree is empty.
+        """
+        if self.is_empty():
+            raise IndexError
+
+        return self.extract_min()
+
+
+class CountedBinarySearchTree(BinarySearchTree):
+    """Binary Search Tree class for a multiset of items.
+
+    A CountedBinarySearchTree has the same interface as a
+    BinarySearchTree, but keeps one node for each distinct item, with
+    a count of how many times the item was inserted. Inserting a
+    duplicate only adds one to that count, so duplicates do not make
+    the tree any deeper, and counting an item takes O(depth) time.
+
+    Every item in the left subtree of a node is < its value, and
+    every item in the right subtree is > it.
+
+    Attributes:
+    - multiplicity (int): how many times root appears in this tree,
+                          or 0 if the tree is empty
+    """
+    __slots__ = ('multiplicity',)
+
+    def __init__(self, root=EmptyValue):
+        """ (CountedBinarySearchTree, object) -> NoneType
+
+        Create a new tree with a given root value, appearing once.
+        An empty tree has its root attribute set to EmptyValue.
+        """
+        if root is EmptyValue:
+            self.multiplicity = 0
+        else:
+            self.multiplicity = 1
+        BinarySearchTree.__init__(self, root)
+
+
+    def _update(self):
+        """ (CountedBinarySearchTree) -> NoneType
+
+        Recompute any data cached on this node from its subtrees.
+        Every copy of the root counts towards the size.
+        """
+        BinarySearchTree._update(self)
+        if not self.is_empty():
+            self._size += self.multiplicity - 1
+
+
+    def _copy_node(self, tree):
+        """ (CountedBinarySearchTree, CountedBinarySearchTree) -> NoneType
+        Store the root value of tree, with its count, in this tree.
+        """
+        self.root = tree.root
+        self.multiplicity = tree.multiplicity
+
+
+    def _build_root(self, items, low, high):
+        """ (CountedBinarySearchTree, list, int, int) -> (int, int)
+
+        Precondition: this tree is empty and items[low:high] is sorted
+        and not empty.
+
+        Store the middle item of items[low:high] in this tree, counted
+        as often as it appears there, and return (left_end, right_start):
+        the items before its copies and the items after them.
+        """
+        item = items[(low + high) // 2]
+        first = bisect_left(items, item, low, high)
+        end = bisect_right(items, item, first, high)
+        self.root = item
+        self.multiplicity = end - first
+        return first, end
+
+
+    def count_all(self, item):
+        """ (CountedBinarySearchTree, object) -> int
+        Return the number of times item appears in this tree.
+        (Return 0 if this tree is empty.)
+        """
+        tree = self
+        while not tree.is_empty():
+            if item == tree.root:
+                return tree.multiplicity
+            elif item < tree.root:
+                tree = tree.left
+            else:
+                tree = tree.right
+        return 0
+
+
+    def count_all2(self, item):
+        """ (CountedBinarySearchTree, object) -> int
+        Return the number of times item appears in this tree.
+        (Return 0 if this tree is empty.)
+        """
+        return self.count_all(item)
+
+
+    def insert(self, item):
+        """ (CountedBinarySearchTree, object) -> NoneType
+
+        Insert item into this tree: count it once more if it is
+        already in the tree, or else add a new leaf for it.
+        """
+        if self.is_empty():
+            self.multiplicity = 1
+            BinarySearchTree.insert(self, item)
+
+        elif item == self.root:
+            self.multiplicity += 1
+            self._update()
+
+        else:
+            BinarySearchTree.insert(self, item)
+
+
+    def _split_batch(self, keys, low, high):
+        """ (CountedBinarySearchTree, list, int, int) -> (int, int)
+
+        Precondition: this tree is not empty and keys[low:high] is sorted.
+
+        Count the copies of the root in keys[low:high] at this node, and
+        return (left_end, right_start): the keys before them belong in
+        the left subtree and the keys after them in the right one.
+        """
+        first = bisect_left(keys, self.root, low, high)
+        end = bisect_right(keys, self.root, first, high)
+        self.multiplicity += end - first
+        return first, end
+
+
+    def delete_root(self):
+        """ (CountedBinarySearchTree) -> NoneType
+
+        Remove one copy of the root value of this tree, and the root
+        node itself once no copies are left.
+        Raise EmptyBSTError if this tree is empty.
+        """
+        if self.is_empty():
+            raise EmptyBSTError
+
+        self._own_children()
+        if self.multiplicity > 1:
+            self.multiplicity -= 1
+
         elif self.left.is_empty() and self.right.is_empty():
-            return 1
-        
+            self.root = EmptyValue
+            self.multiplicity = 0
+            self.left = None
+            self.right = None
+
+        elif not self.left.is_empty():
+            # move the whole maximum node of the left subtree up
+            self._copy_node(self.left._extract_max_node())
+
         else:
-            depth_left = 1 + self.left.depth()
-            depth_right = 1 + self.right.depth()
-            
-            return max([depth_left,depth_right])
-        
-        
+            self._copy_node(self.right._extract_min_node())
+        self._update()
+
+
+    def extract_max(self):
+        """ (CountedBinarySearchTree) -> object
+
+        Remove one copy of the maximum item stored in this tree,
+        and return it.
+        Raise EmptyBSTError if this tree is empty.
+        """
+        if (not self.is_empty() and self.right.is_empty() and
+                self.multiplicity > 1):
+            self.multiplicity -= 1
+            self._update()
+            return self.root
+
+        return BinarySearchTree.extract_max(self)
+
+
+    def extract_min(self):
+        """ (CountedBinarySearchTree) -> object
+
+        Remove one copy of the minimum item stored in this tree,
+        and return it.
+        Raise EmptyBSTError if this tree is empty.
+        """
+        if (not self.is_empty() and self.left.is_empty() and
+                self.multiplicity > 1):
+            self.multiplicity -= 1
+            self._update()
+            return self.root
+
+        return BinarySearchTree.extract_min(self)
+
+
+    def remove_smallest(self):
+        """ (CountedBinarySearchTree) -> object
+        Remove one copy of the minimum item stored in this tree,
+        and return it.
+        Raise IndexError if this tree is empty.
+        """
+        if self.is_empty():
+            raise IndexError
+
+        return self.extract_min()
+
+
+    def iter_counts(self):
+        """ (CountedBinarySearchTree) -> generator
+
+        Yield (item, count) for every distinct item in this tree,
+        in sorted order.
+        """
+        for tree in self._in_order_trees():
+            yield tree.root, tree.multiplicity
+
+
+    def iter_range(self, low, high):
+        """ (CountedBinarySearchTree, object, object) -> generator
+
+        Yield every copy of the items in this tree whose value is
+        between low and high, inclusive, in sorted order.
+        """
+        for tree in self._range_trees(low, high):
+            yield from repeat(tree.root, tree.multiplicity)
+
+
+    def iter_pre_order(self):
+        """ (CountedBinarySearchTree) -> generator
+        Yield every copy of the items in this tree in pre-order.
+        """
+        for tree in self._pre_order_trees():
+            yield from repeat(tree.root, tree.multiplicity)
+
+
+    def iter_in_order(self):
+        """ (CountedBinarySearchTree) -> generator
+        Yield every copy of the items in this tree in sorted order.
+        """
+        for tree in self._in_order_trees():
+            yield from repeat(tree.root, tree.multiplicity)
+
+
+    def iter_post_order(self):
+        """ (CountedBinarySearchTree) -> generator
+        Yield every copy of the items in this tree in post-order.
+        """
+        for tree in self._post_order_trees():
+            yield from repeat(tree.root, tree.multiplicity)
+
+
+    def __reversed__(self):
+        """ (CountedBinarySearchTree) -> generator
+        Yield every copy of the items in this tree in reverse sorted order.
+        """
+        for tree in self._in_order_trees(reverse=True):
+            yield from repeat(tree.root, tree.multiplicity)
+
+
+    def list_duplicates(self):
+        """ (CountedBinarySearchTree) -> list
+
+        Return a sorted list with every item in this tree once for each
+        extra time it appears, in O(distinct items + duplicates) time.
+        """
+        duplicates = []
+        for item, multiplicity in self.iter_counts():
+            duplicates.extend(repeat(item, multiplicity - 1))
+        return duplicates
+
+
+    def list_range2(self, low, high):
+        """ (CountedBinarySearchTree, object, object) -> list
+
+        Return a sorted list of every copy of the items in this tree
+        whose value is between low and high, inclusive.
+        """
+        return self.list_range(low, high)
+
+
+    def list_leaves(self):
+        """ (CountedBinarySearchTree) -> list
+        Return a sorted list of every copy of the items stored in leaves.
+        """
+        leaves = []
+        for tree in self._in_order_trees():
+            if tree.left.is_empty() and tree.right.is_empty():
+                leaves.extend(repeat(tree.root, tree.multiplicity))
+        return leaves
+
+
+    def multiply_leaves(self):
+        """ (CountedBinarySearchTree) -> object
+        Return the product of every copy of the items stored in leaves.
+        """
+        product = 1
+        for item in self.list_leaves():
+            product = product * item
+        return product
+
+
+    def multiply_non_leaves(self):
+        """ (CountedBinarySearchTree) -> object
+        Return the product of every copy of the items stored in non-leaves.
+        """
+        product = 1
+        for tree in self._in_order_trees():
+            if not (tree.left.is_empty() and tree.right.is_empty()):
+                for item in repeat(tree.root, tree.multiplicity):
+                    product = product * item
+        return product
+
+
+def _subtract(count, other_count):
+    """ (int, int) -> int
+    Return count - other_count.
+    """
+    return count - other_count
+
+
+def _merge_counts(counts, other_counts, combine):
+    """ (iterator, iterator, function) -> generator
+
+    Precondition: counts and other_counts yield (item, count) pairs
+    in sorted order of distinct items.
+
+    Yield, in sorted order, every item from either stream, repeated
+    combine(count, other_count) times, where an item missing from a
+    stream has count 0 there.
+    """
+    pair = next(counts, None)
+    other_pair = next(other_counts, None)
+    while pair is not None or other_pair is not None:
+        if other_pair is None or (pair is not None and
+                                  pair[0] < other_pair[0]):
+            item, copies = pair[0], combine(pair[1], 0)
+            pair = next(counts, None)
+        elif pair is None or other_pair[0] < pair[0]:
+            item, copies = other_pair[0], combine(0, other_pair[1])
+            other_pair = next(other_counts, None)
+        else:
+            item, copies = pair[0], combine(pair[1], other_pair[1])
+            pair = next(counts, None)
+            other_pair = next(other_counts, None)
+        yield from repeat(item, copies)
+
+
 def copy(bt):
-    
-    if bt.is_empty():
-        return BinarySearchTree()
-    
-    else:
-        new_bt = BinarySearchTree(bt.root)
-        bt.left = copy(bt.left)
-        bt.right = copy(bt.right)
-        return new_bt 
+    """ (BinarySearchTree) -> BinarySearchTree
+    Return a copy of bt that shares no nodes with it.
+    """
+    return bt.clone()
 
 
 def copy_into(bt1, bt2):
-    
-    if bt1.is_empty():
-        if not bt2.is_empty():
-            bt2.delete_root()
-            copy_into(bt1, bt2)
-            
-    elif bt2.is_empty():
-        bt2.root = bt1.root
-        bt2.left = BinarySearchTree()
-        bt2.right = BinarySearchTree()
-        copy_into(bt1.left,bt2.left)
-        copy_into(bt1.right,bt2.right)
-        
-    else:
-        if bt1.root != bt2.root:
-            bt2.root = bt1.root
-            
-        copy_into(bt1.left,bt2.left)
-        copy_into(bt1.right,bt2.right)
+    """ (BinarySearchTree, BinarySearchTree) -> NoneType
+    Make bt2 a copy of bt1 that shares no nodes with it.
+    """
+    bt2._clear()
+    bt2._move_from(bt1.clone())
 
         
 def change_root(tree, item):
     
     if tree.is_empty():
-        tree.root = item
+        tree.insert(item)
     
     else:
+        tree._own_children()
         tree.root = item
+        tree._update()
         if not tree.left.is_empty():
             if (tree.root < tree.left.root):
                 node_to_insert = tree.left.extract_max()
@@ -478,22 +1723,28 @@ def change_root(tree, item):
                 
 
 def is_BST(bt):
-    
-    if bt.is_empty():
-        return True
-    
-    elif bt.right.is_empty() and bt.left.is_empty():
-        return True
-    
-    elif bt.right.is_empty():
-        return ((bt.root >= bt.left.root) and is_BST(bt.left))
-    
-    elif bt.left.is_empty():
-        return ((bt.root < bt.right.root) and is_BST(bt.right))
-    
-    else:
-        return ((bt.root >= bt.left.root) and (bt.root < bt.right.root)
-                and is_BST(bt.left) and is_BST(bt.right))
+    """ (BinarySearchTree) -> bool
+
+    Return True if bt satisfies the Binary Search Tree property, checking
+    every item against the bounds set by all of its ancestors, in one
+    pass over an explicit stack. Items equal to a root are allowed in its
+    right subtree if bt's class says so, as in an AVLTree.
+    """
+    equal_on_right = bt.equal_on_right
+    # each entry is (tree, low, high): the items of tree must be > low
+    # (or >= low) and <= high, where EmptyValue means there is no such bound
+    stack = [(bt, EmptyValue, EmptyValue)]
+    while stack:
+        tree, low, high = stack.pop()
+        if not tree.is_empty():
+            if low is not EmptyValue and not (
+                    tree.root > low or (equal_on_right and tree.root == low)):
+                return False
+            elif high is not EmptyValue and not tree.root <= high:
+                return False
+            stack.append((tree.left, low, tree.root))
+            stack.append((tree.right, tree.root, high))
+    return True
 
 
 def is_BST2(bt):
@@ -507,7 +1758,11 @@ def is_BST2(bt):
     elif not bt.left.is_empty() and get_max(bt.left) > bt.root:
         return False
     
-    elif not bt.right.is_empty() and get_min(bt.right) <= bt.root:
+    elif not bt.right.is_empty() and get_min(bt.right) < bt.root:
+        return False
+    
+    elif (not bt.right.is_empty() and get_min(bt.right) == bt.root and
+          not bt.equal_on_right):
         return False
     
     elif not is_BST(bt.left) or not is_BST(bt.right):
@@ -518,30 +1773,21 @@ def is_BST2(bt):
 
 
 def get_max(bt):
-    
-    if bt.is_empty():
-        pass
-    
-    elif bt.right.is_empty():
-        return bt.root
-    
-    else:
-        return get_max(bt.right)
+    """ (BinarySearchTree) -> object
+    Return the maximum item in bt, cached on its root,
+    or None if bt is empty.
+    """
+    if not bt.is_empty():
+        return bt._max
 
   
 def get_min(bt):
-    
-    if bt.is_empty():
-        pass
-    
-    elif bt.left.is_empty() and bt.right.is_empty():
-        return bt.root
-    
-    elif bt.left.is_empty():
-        return bt.root
-    
-    else:
-        return get_min(bt.left)
+    """ (BinarySearchTree) -> object
+    Return the minimum item in bt, cached on its root,
+    or None if bt is empty.
+    """
+    if not bt.is_empty():
+        return bt._min
 
        
 def find_duplicates(bst):
@@ -564,7 +1810,8 @@ def count(item, bst):
         return 0
     
     elif item == bst.root:
-        return 1 + count(item, bst.left)
+        # count_all2 knows where a tree keeps the copies of its root
+        return bst.count_all2(item)
     
     elif item < bst.root:
         return 0 + count(item, bst.left)
@@ -599,11 +1846,11 @@ def kth_largest(bst, k):
     if bst.is_empty():
         pass
     
-    elif k == bst.right.size() + 1:
+    elif bst.right.size() < k <= bst.size() - bst.left.size():
         return bst.root
     
-    elif k > bst.right.size() + 1:
-        return kth_largest(bst.left, k - (bst.right.size() + 1))
+    elif k > bst.size() - bst.left.size():
+        return kth_largest(bst.left, k - (bst.size() - bst.left.size()))
     
     else:
         return kth_largest(bst.right, k)
@@ -622,35 +1869,24 @@ def list_items_gt_10(bst):
     
 
 def insert_list(bst,lst):
-    
-    if bst.is_empty():
-        if not len(lst) == 0:
-            bst.root = lst.pop()
-            bst.left = BinarySearchTree()
-            bst.right = BinarySearchTree()
-            insert_list(bst,lst)
-    
-    else:
-        left_items = []
-        right_items = []
-        
-        for item in lst:
-            if item <= bst.root:
-                left_items.append(item)
-            else:
-                right_items.append(item)
-                
-        insert_list(bst.left, left_items)
-        insert_list(bst.right, right_items)
+    """ (BinarySearchTree, iterable) -> NoneType
+
+    Insert every item in lst into bst. lst is not changed.
+    An empty bst is filled with a balanced tree in one pass.
+    """
+    bst.insert_many(lst)
 
         
 def count_nodes(bt):
-    
-    if bt.is_empty():
-        return 0
+    """ (BinarySearchTree) -> int
+    Return the number of nodes in bt.
+    """
+    if isinstance(bt, CountedBinarySearchTree):
+        # a node may hold several items, so walk the distinct ones
+        return sum(1 for tree in bt._in_order_trees())
     
     else:
-        return 1 + count_nodes(bt.left) + count_nodes(bt.right)
+        return bt.size()
 
 
 def count_nodes_valid(bt):
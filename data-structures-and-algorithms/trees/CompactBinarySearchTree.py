@@ -0,0 +1,406 @@
+from array import array
+from bisect import bisect_right
+
+from BinarySearchTree import EmptyBSTError
+
+
+NIL = -1    # index used for an empty subtree
+
+
+class CompactBinarySearchTree:
+    """Array-backed Binary Search Tree class.
+
+    This class stores the same kind of tree as BinarySearchTree, with the
+    same Binary Search Tree property: for every node, its value is >= all
+    items stored in its left subtree, and < all items stored in its right
+    subtree.
+
+    Instead of one object per node (plus one per empty subtree), node i is
+    described by keys[i], left[i] and right[i], where left and right are
+    arrays of node indexes and NIL marks an empty subtree. A node costs
+    two machine integers plus its key, and with a typecode the keys are
+    stored unboxed as well. Slots of deleted nodes are reused by later
+    insertions.
+
+    Attributes:
+    - keys (list or array): the item stored in each node
+    - left (array): the index of each node's left child, or NIL
+    - right (array): the index of each node's right child, or NIL
+    - root (int): the index of the root node, or NIL if the tree is empty
+    - typecode (str): the array typecode of keys, or None if keys is a list
+    """
+
+    def __init__(self, items=(), typecode=None):
+        """ (CompactBinarySearchTree, iterable, str) -> NoneType
+
+        Create a new tree containing the items in items, inserted in order.
+        If typecode is given (e.g. 'l' or 'd'), keys are stored in an
+        array of that type instead of a list.
+        """
+        self.typecode = typecode
+        if typecode is None:
+            self.keys = []
+        else:
+            self.keys = array(typecode)
+        self.left = array('l')
+        self.right = array('l')
+        self.root = NIL
+        self._free = array('l')    # indexes of slots freed by deletions
+        self._size = 0
+
+        for item in items:
+            self.insert(item)
+
+
+    @classmethod
+    def from_iterable(cls, items, presorted=False, typecode=None):
+        """ (type, iterable, bool, str) -> CompactBinarySearchTree
+
+        Return a new, balanced tree containing every item in items.
+        items is sorted once first, unless presorted is True.
+        Nodes are laid out in pre-order, so that a traversal reads the
+        arrays mostly front to back.
+
+        Every copy of an item must go in the left subtree of another copy,
+        so a run of k equal items adds up to k to the depth.
+        """
+        if presorted:
+            items = list(items)
+        else:
+            items = sorted(items)
+
+        tree = cls(typecode=typecode)
+        tree.root = tree._build(items, 0, len(items))
+        return tree
+
+
+    def _build(self, items, low, high):
+        """ (CompactBinarySearchTree, list, int, int) -> int
+
+        Add a balanced tree of the sorted items[low:high] and return the
+        index of its root, or NIL if there are no items. Works from an
+        explicit stack, so long runs of duplicates are safe.
+        """
+        if low >= high:
+            return NIL
+
+        root = NIL
+        # each entry is (low, high, parent, links): the part still to be
+        # built, and the array of parent's links that must point to it
+        stack = [(low, high, NIL, None)]
+        while stack:
+            low, high, parent, links = stack.pop()
+            # duplicates of the root must all go in the left subtree
+            mid = bisect_right(items, items[(low + high) // 2], low, high) - 1
+
+            node = self._new_node(items[mid])
+            if parent == NIL:
+                root = node
+            else:
+                links[parent] = node
+
+            # push right first, so that nodes are laid out in pre-order
+            if mid + 1 < high:
+                stack.append((mid + 1, high, node, self.right))
+            if low < mid:
+                stack.append((low, mid, node, self.left))
+        return root
+
+
+    def _new_node(self, item):
+        """ (CompactBinarySearchTree, object) -> int
+
+        Store item in a new leaf node, and return the index of the node.
+        """
+        self._size += 1
+        if self._free:
+            node = self._free.pop()
+            self.keys[node] = item
+            self.left[node] = NIL
+            self.right[node] = NIL
+        else:
+            node = len(self.keys)
+            self.keys.append(item)
+            self.left.append(NIL)
+            self.right.append(NIL)
+        return node
+
+
+    def _free_node(self, node):
+        """ (CompactBinarySearchTree, int) -> NoneType
+
+        Release the slot of a node that is no longer in the tree.
+        """
+        self._size -= 1
+        if self.typecode is None:
+            self.keys[node] = None    # don't keep the item alive
+        self._free.append(node)
+
+
+    def is_empty(self):
+        """ (CompactBinarySearchTree) -> bool
+        Return True if this tree is empty.
+        """
+        return self.root == NIL
+
+
+    def size(self):
+        """ (CompactBinarySearchTree) -> int
+        Return the number of items in this tree.
+        """
+        return self._size
+
+
+    def __len__(self):
+        """ (CompactBinarySearchTree) -> int
+        Return the number of items in this tree.
+        """
+        return self._size
+
+
+    def __contains__(self, item):
+        """ (CompactBinarySearchTree, object) -> bool
+        Return True if this tree contains item.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while node != NIL:
+            key = keys[node]
+            if item == key:
+                return True
+            elif item < key:
+                node = left[node]
+            else:
+                node = right[node]
+        return False
+
+
+    def count_all(self, item):
+        """ (CompactBinarySearchTree, object) -> int
+        Return the number of times item appears in this tree.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        count = 0
+        node = self.root
+        while node != NIL:
+            key = keys[node]
+            if item == key:
+                # duplicates are always in the left subtree
+                count += 1
+                node = left[node]
+            elif item < key:
+                node = left[node]
+            else:
+                node = right[node]
+        return count
+
+
+    def insert(self, item):
+        """ (CompactBinarySearchTree, object) -> NoneType
+
+        Insert item into this tree in the correct location.
+        Do not change positions of any other nodes.
+        """
+        new_node = self._new_node(item)
+        if self.root == NIL:
+            self.root = new_node
+            return
+
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while True:
+            if item <= keys[node]:
+                if left[node] == NIL:
+                    left[node] = new_node
+                    return
+                node = left[node]
+            else:
+                if right[node] == NIL:
+                    right[node] = new_node
+                    return
+                node = right[node]
+
+
+    def delete(self, item):
+        """ (CompactBinarySearchTree, object) -> NoneType
+
+        Remove item from this tree.
+        Do nothing is this tree doesn't contain item.
+        """
+        keys = self.keys
+        parent = NIL
+        node = self.root
+        while node != NIL and keys[node] != item:
+            parent = node
+            if item < keys[node]:
+                node = self.left[node]
+            else:
+                node = self.right[node]
+
+        if node != NIL:
+            self._delete_node(node, parent)
+
+
+    def _delete_node(self, node, parent):
+        """ (CompactBinarySearchTree, int, int) -> NoneType
+
+        Remove node, whose parent is parent (or NIL for the root).
+        """
+        left, right = self.left, self.right
+        if left[node] != NIL and right[node] != NIL:
+            # Replace the item with the maximum of the left subtree,
+            # and remove that node instead; it has no right child.
+            max_parent = node
+            max_node = left[node]
+            while right[max_node] != NIL:
+                max_parent = max_node
+                max_node = right[max_node]
+            self.keys[node] = self.keys[max_node]
+            node, parent = max_node, max_parent
+
+        # node has at most one child now: link it to parent instead
+        if left[node] != NIL:
+            child = left[node]
+        else:
+            child = right[node]
+
+        if parent == NIL:
+            self.root = child
+        elif left[parent] == node:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._free_node(node)
+
+
+    def extract_max(self):
+        """ (CompactBinarySearchTree) -> object
+
+        Remove and return the maximum item stored in this tree.
+        Raise EmptyBSTError if this tree is empty.
+        """
+        if self.root == NIL:
+            raise EmptyBSTError
+
+        parent = NIL
+        node = self.root
+        while self.right[node] != NIL:
+            parent = node
+            node = self.right[node]
+        item = self.keys[node]
+        self._delete_node(node, parent)
+        return item
+
+
+    def extract_min(self):
+        """ (CompactBinarySearchTree) -> object
+
+        Remove and return the minimum item stored in this tree.
+        Raise EmptyBSTError if this tree is empty.
+        """
+        if self.root == NIL:
+            raise EmptyBSTError
+
+        parent = NIL
+        node = self.root
+        while self.left[node] != NIL:
+            parent = node
+            node = self.left[node]
+        item = self.keys[node]
+        self._delete_node(node, parent)
+        return item
+
+
+    def iter_in_order(self):
+        """ (CompactBinarySearchTree) -> generator
+        Yield the items in this tree in sorted order.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        node = self.root
+        while stack or node != NIL:
+            if node != NIL:
+                stack.append(node)
+                node = left[node]
+            else:
+                node = stack.pop()
+                yield keys[node]
+                node = right[node]
+
+
+    def __iter__(self):
+        """ (CompactBinarySearchTree) -> generator
+        Yield the items in this tree in sorted order.
+        """
+        return self.iter_in_order()
+
+
+    def in_order(self):
+        """ (CompactBinarySearchTree) -> list
+        Return a sorted list of the items in this tree.
+        """
+        return list(self.iter_in_order())
+
+
+    def iter_range(self, low, high):
+        """ (CompactBinarySearchTree, object, object) -> generator
+
+        Yield the items in this tree whose value is between low and high,
+        inclusive, in sorted order, skipping subtrees outside the range.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        node = self.root
+        while stack or node != NIL:
+            if node != NIL:
+                if keys[node] >= low:
+                    stack.append(node)
+                    node = left[node]
+                else:
+                    node = right[node]
+            else:
+                node = stack.pop()
+                if keys[node] > high:
+                    return
+                yield keys[node]
+                node = right[node]
+
+
+    def list_range(self, low, high):
+        """ (CompactBinarySearchTree, object, object) -> list
+
+        Return a sorted list of the items in this tree whose value is
+        between low and high, inclusive.
+        """
+        return list(self.iter_range(low, high))
+
+
+    def range(self, low, high):
+        """ (CompactBinarySearchTree, object, object) -> int
+
+        Return the number of items in this tree whose value is
+        between low and high, inclusive.
+        """
+        count = 0
+        for item in self.iter_range(low, high):
+            count += 1
+        return count
+
+
+    def depth(self):
+        """ (CompactBinarySearchTree) -> int
+        Return the depth of this tree.
+        """
+        if self.root == NIL:
+            return 0
+
+        deepest = 0
+        stack = [(self.root, 1)]
+        while stack:
+            node, depth = stack.pop()
+            deepest = max(deepest, depth)
+            if self.left[node] != NIL:
+                stack.append((self.left[node], depth + 1))
+            if self.right[node] != NIL:
+                stack.append((self.right[node], depth + 1))
+        return deepest
@@ -5,12 +5,62 @@ class EmptyValue:
     pass
 
 class Tree:
+    """A tree with any number of subtrees at each node.
+
+    Attributes:
+    - root (object): the root value stored in the tree, or EmptyValue
+                     if the tree is empty
+    - subtrees (list of Tree): the subtrees of this tree
+
+    Every node caches a digest of its whole subtree. The methods and
+    functions in this module that change a tree forget it on every node
+    on the path to the change. A subtree changed any other way has no
+    link back to its ancestors: call invalidate on each of them.
+    """
     
     def __init__(self,root=EmptyValue):
         self.root = root;
-        self.children = [];
+        self.subtrees = [];
+        self._digest = None
         
+    
+    def invalidate(self):
+        """ (Tree) -> NoneType
+        Forget the cached digest of this tree, after it has changed.
+        """
+        self._digest = None
         
+
+    def digest(self):
+        """ (Tree) -> int
+
+        Return a hash of this tree's root and, in order, the digests of
+        its subtrees. Digests are cached on every node until it changes,
+        so only the changed paths are rehashed, and once both trees have
+        one, == returns False at once when they differ.
+        The items must be hashable.
+        """
+        # each entry is (tree, True) once its subtrees have digests
+        stack = [(self, False)]
+        while stack:
+            tree, ready = stack.pop()
+            if tree._digest is not None:
+                continue
+            elif ready:
+                if tree.is_empty():
+                    tree._digest = hash(EmptyValue)
+                else:
+                    tree._digest = hash((tree.root,
+                                         tuple([subtree._digest for subtree
+                                                in tree.subtrees])))
+            else:
+                stack.append((tree, True))
+                for subtree in tree.subtrees:
+                    stack.append((subtree, False))
+        return self._digest
+
+        
+
     def is_empty(self):
         """ (Tree) -> bool
         Return True if self is empty.
@@ -23,6 +73,7 @@ class Tree:
         Add the trees in new_tree as subtrees of this tree.
         """
         self.subtrees = self.subtrees + new_trees
+        self._digest = None
         
 
     def size(self):
@@ -71,6 +122,7 @@ class Tree:
         """ (Tree) -> NoneType
         Remove the root item of this tree.
         """
+        self._digest = None
         
         if len(self.subtrees) == 0:
             # Base case when empty or just one node
@@ -109,6 +161,7 @@ class Tree:
                     # If the subtree is now empty, remove it!
                     if subtree.is_empty():
                         self.subtrees.remove(subtree)
+                    self._digest = None
                     return True
             return False
         
@@ -181,6 +234,7 @@ class Tree:
         (Tree) -> object
         Delete and return a leaf (first in traversal).
         """
+        self._digest = None
         if self.subtrees == []:
             temp = self.root
             self.root = EmptyValue
@@ -205,17 +259,20 @@ class Tree:
         ## if item is equal to root, and has no children
         elif self.root == item and (self.subtrees == []):
             self.root = EmptyValue
+            self._digest = None
             return True
         
         ## if item is equal to root and tree has children    
         elif self.root == item:
             self.root = self.delete_leaf()
+            self._digest = None
             return True
         
         ## recursive call   
         else:
             for subtree in self.subtrees:
                 if subtree.delete_item(item):
+                    self._digest = None
                     return True
             
             return False
@@ -324,11 +381,12 @@ class Tree:
             pass
     
         else:
+            self._digest = None
             for subtree in self.subtrees:
                 if subtree.root == self.root:
                     #subtree.purge_clones()
                     subtree.delete_root()
-                    tree.purge_clones()
+                    self.purge_clones()
                 else:
                     subtree.purge_clones()
     
@@ -336,6 +394,7 @@ class Tree:
     def insert(self, item):
         """ (Tree, object) -> NoneType
         """
+        self._digest = None
         if self.is_empty():
             self.root = item
             
@@ -355,23 +414,37 @@ class Tree:
     def __eq__(self, other):
         """ (Tree, Tree) -> bool
 
-        Return True if this tree and the other tree are equal trees.
+        Return True if this tree and the other tree are equal trees:
+        equal roots, and the same number of subtrees, equal in order.
+        Compares pairs of nodes from an explicit stack rather than
+        recursing, and stops at the first pair that differs, or whose
+        cached digests differ.
         """
-        if self.is_empty() and other.is_empty():
-            return True
-        
-        elif self.is_empty() or other.is_empty():
-            return False
-        
-        elif (self.root != other.root):
+        if not isinstance(other, Tree):
             return False
         
-        else:
-            for sub, oth_sub in zip(self.subtrees,other.subtrees):
-                if not sub.__eq__(oth_sub):
+        stack = [(self, other)]
+        while stack:
+            tree, other_tree = stack.pop()
+            if tree is other_tree:
+                continue
+            
+            elif tree.is_empty() or other_tree.is_empty():
+                if not (tree.is_empty() and other_tree.is_empty()):
                     return False
             
-            return True
+            elif (tree._digest is not None and other_tree._digest is not None
+                  and tree._digest != other_tree._digest):
+                return False
+            
+            elif (tree.root != other_tree.root or
+                  len(tree.subtrees) != len(other_tree.subtrees)):
+                return False
+            
+            else:
+                stack.extend(zip(tree.subtrees, other_tree.subtrees))
+        
+        return True
     
     
     def common_items(self, other):
@@ -516,6 +589,8 @@ def make_binary(tree):
             
         for extra_tree in extra_trees:
             tree.subtrees[0].subtrees += [extra_tree]
+        tree.subtrees[0].invalidate()
+        tree.invalidate()
             
         for subtree in tree.subtrees:
             make_binary(subtree)
@@ -538,6 +613,8 @@ def limit_branches(tree, d):
             
         for extra_tree in extra_trees:
             tree.subtrees[0].subtrees += [extra_tree]
+        tree.subtrees[0].invalidate()
+        tree.invalidate()
             
         for subtree in tree.subtrees:
             limit_branches(subtree,d)
@@ -581,11 +658,13 @@ def deepen(tree):
     elif not tree.subtrees:
         expand_tree = Tree(tree.root)
         tree.subtrees.append(expand_tree)
+        tree.invalidate()
     
     else:
         expand_tree = Tree(tree.root)
         expand_tree.subtrees = tree.subtrees
         tree.subtrees = [expand_tree]
+        tree.invalidate()
         for subtree in expand_tree.subtrees:
             deepen(subtree)
             
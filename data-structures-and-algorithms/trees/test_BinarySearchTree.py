@@ -0,0 +1,260 @@
+import random
+import unittest
+
+from BinarySearchTree import (BinarySearchTree, AVLTree,
+                              CountedBinarySearchTree, is_BST, kth_largest)
+
+
+TREE_CLASSES = (BinarySearchTree, AVLTree, CountedBinarySearchTree)
+
+ITEMS = [50, 30, 70, 20, 40, 60, 80, 30, 65, 10, 45, 70, 35]
+
+# Each change is applied to one tree and must not be seen by the other.
+CHANGES = [
+    ('insert', lambda bst: bst.insert(33)),
+    ('insert duplicate', lambda bst: bst.insert(40)),
+    ('insert many', lambda bst: [bst.insert(i) for i in range(100)]),
+    ('delete', lambda bst: bst.delete(40)),
+    ('delete root', lambda bst: bst.delete_root()),
+    ('extract max', lambda bst: bst.extract_max()),
+    ('extract min', lambda bst: bst.extract_min()),
+    ('remove smallest', lambda bst: bst.remove_smallest()),
+    ('rotate_cw', lambda bst: bst.rotate_cw()),
+    ('rotate_cc', lambda bst: bst.rotate_cc()),
+    ('split', lambda bst: bst.split(45)),
+    ('batch insert_many', lambda bst: bst.insert_many([5, 40, 41, 99, 99])),
+    ('batch delete_many', lambda bst: bst.delete_many([10, 30, 70, 80])),
+    ('batch contains_many', lambda bst: bst.contains_many([30, 31])),
+    ('map_f', lambda bst: bst.map_f(lambda item: item * 2)),
+]
+
+
+def state(bst):
+    """ (BinarySearchTree) -> tuple
+    Return everything about bst that a change to another tree must not alter.
+    """
+    return (bst.pre_order(), bst.in_order(), bst.size(), bst.depth(),
+            is_BST(bst))
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_snapshot_unchanged_by_source(self):
+        for cls in TREE_CLASSES:
+            for name, change in CHANGES:
+                with self.subTest(cls=cls.__name__, change=name):
+                    source = cls.from_iterable(ITEMS)
+                    snap = source.snapshot()
+                    before = state(snap)
+                    change(source)
+                    self.assertEqual(state(snap), before)
+
+
+    def test_source_unchanged_by_snapshot(self):
+        for cls in TREE_CLASSES:
+            for name, change in CHANGES:
+                with self.subTest(cls=cls.__name__, change=name):
+                    source = cls.from_iterable(ITEMS)
+                    before = state(source)
+                    snap = source.snapshot()
+                    change(snap)
+                    self.assertEqual(state(source), before)
+
+
+    def test_snapshot_of_snapshot(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                source = cls.from_iterable(ITEMS)
+                first = source.snapshot()
+                second = first.snapshot()
+                before = state(source)
+                first.delete(50)
+                second.insert_many([1, 2, 3])
+                self.assertEqual(state(source), before)
+                self.assertEqual(second.in_order(), sorted(ITEMS + [1, 2, 3]))
+                expected = sorted(ITEMS)
+                expected.remove(50)
+                self.assertEqual(first.in_order(), expected)
+
+
+    def test_join_leaves_snapshots_alone(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                left = cls.from_iterable([1, 2, 3, 4])
+                right = cls.from_iterable([10, 20, 30])
+                left_snap, right_snap = left.snapshot(), right.snapshot()
+                joined = cls.join(left, right)
+                joined.delete(3)
+                joined.delete(20)
+                self.assertEqual(left_snap.in_order(), [1, 2, 3, 4])
+                self.assertEqual(right_snap.in_order(), [10, 20, 30])
+
+
+    def test_random_changes(self):
+        rng = random.Random(25)
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                tree = cls.from_iterable(rng.randrange(50) for i in range(40))
+                snaps = []
+                for step in range(200):
+                    snaps.append((tree.snapshot(), state(tree)))
+                    item = rng.randrange(50)
+                    if rng.random() < 0.5:
+                        tree.insert(item)
+                    else:
+                        tree.delete(item)
+                for snap, before in snaps:
+                    self.assertEqual(state(snap), before)
+
+
+    def test_order_queries_on_snapshot(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                bst = cls.from_iterable(ITEMS)
+                snap = bst.snapshot()
+                bst.delete_many([30, 30, 70])
+                bst.insert(31)
+                items = sorted(ITEMS)
+                self.assertEqual([snap.select(k) for k in range(len(items))],
+                                 items)
+                self.assertEqual(snap.rank(70), items.index(70))
+                self.assertEqual(snap.range(30, 70), 10)
+                self.assertEqual(bst.range(30, 70), 8)
+
+
+class TestOrderStatistics(unittest.TestCase):
+
+    def test_select_rank_range(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                bst = cls.from_iterable(ITEMS)
+                items = sorted(ITEMS)
+                for k in range(-len(items), len(items)):
+                    self.assertEqual(bst.select(k), items[k])
+                self.assertRaises(IndexError, bst.select, len(items))
+                for item in range(0, 90, 5):
+                    below = sum(1 for other in items if other < item)
+                    self.assertEqual(bst.rank(item), below)
+                    for high in range(item - 5, 90, 15):
+                        inside = [other for other in items
+                                  if item <= other <= high]
+                        self.assertEqual(bst.range(item, high), len(inside))
+
+
+    def test_kth_largest(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                bst = cls.from_iterable(ITEMS)
+                items = sorted(ITEMS, reverse=True)
+                for k in range(1, len(items) + 1):
+                    self.assertEqual(kth_largest(bst, k), items[k - 1])
+
+
+    def test_sizes_kept_through_changes(self):
+        rng = random.Random(2)
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                bst = cls()
+                items = []
+                for step in range(300):
+                    item = rng.randrange(40)
+                    if rng.random() < 0.6:
+                        bst.insert(item)
+                        items.append(item)
+                    elif item in items:
+                        bst.delete(item)
+                        items.remove(item)
+                items.sort()
+                self.assertEqual(bst.size(), len(items))
+                self.assertEqual([bst.select(k) for k in range(len(items))],
+                                 items)
+                self.assertEqual(bst.rank(20), sum(1 for item in items
+                                                   if item < 20))
+                self.assertEqual(bst.range(10, 30), sum(1 for item in items
+                                                        if 10 <= item <= 30))
+
+
+class TestSetAlgebra(unittest.TestCase):
+
+    def setUp(self):
+        self.first = [1, 2, 2, 3, 5, 5, 5, 8]
+        self.second = [2, 3, 3, 5, 9]
+
+
+    def test_union(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                tree = cls.from_iterable(self.first)
+                other = cls.from_iterable(self.second)
+                result = tree.union(other)
+                self.assertEqual(result.in_order(),
+                                 [1, 2, 2, 3, 3, 5, 5, 5, 8, 9])
+                self.assertTrue(is_BST(result))
+
+
+    def test_intersection(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                tree = cls.from_iterable(self.first)
+                other = cls.from_iterable(self.second)
+                result = tree.intersection(other)
+                self.assertEqual(result.in_order(), [2, 3, 5])
+                self.assertTrue(is_BST(result))
+
+
+    def test_difference(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                tree = cls.from_iterable(self.first)
+                other = cls.from_iterable(self.second)
+                self.assertEqual(tree.difference(other).in_order(),
+                                 [1, 2, 5, 5, 8])
+                self.assertEqual(other.difference(tree).in_order(), [3, 9])
+
+
+    def test_sources_unchanged(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                tree = cls.from_iterable(self.first)
+                other = cls.from_iterable(self.second)
+                before = state(tree), state(other)
+                tree.union(other)
+                tree.intersection(other)
+                tree.difference(other)
+                self.assertEqual((state(tree), state(other)), before)
+
+
+    def test_split(self):
+        for cls in TREE_CLASSES:
+            for key in (0, 30, 33, 70, 100):
+                with self.subTest(cls=cls.__name__, key=key):
+                    bst = cls.from_iterable(ITEMS)
+                    low, high = bst.split(key)
+                    self.assertTrue(bst.is_empty())
+                    self.assertEqual(low.in_order(),
+                                     sorted(item for item in ITEMS
+                                            if item <= key))
+                    self.assertEqual(high.in_order(),
+                                     sorted(item for item in ITEMS
+                                            if item > key))
+                    self.assertTrue(is_BST(low) and is_BST(high))
+                    self.assertEqual(low.size() + high.size(), len(ITEMS))
+
+
+    def test_join(self):
+        for cls in TREE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                low, high = cls.from_iterable(ITEMS).split(45)
+                tree = cls.join(low, high)
+                self.assertTrue(low.is_empty() and high.is_empty())
+                self.assertEqual(tree.in_order(), sorted(ITEMS))
+                self.assertTrue(is_BST(tree))
+                self.assertEqual(tree.size(), len(ITEMS))
+
+                self.assertRaises(ValueError, cls.join,
+                                  cls.from_iterable([1, 6]),
+                                  cls.from_iterable([5, 9]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import random
+import unittest
+
+import Tree
+from Tree import EmptyValue
+
+
+def fresh_digest(tree):
+    """ (Tree) -> int
+    Return the digest of tree, computed without any cached digests.
+    """
+    if tree.is_empty():
+        return hash(EmptyValue)
+    return hash((tree.root,
+                 tuple([fresh_digest(subtree) for subtree in tree.subtrees])))
+
+
+def rebuild(tree):
+    """ (Tree) -> Tree
+    Return a copy of tree made of new nodes, with no cached digests.
+    """
+    copy = Tree.Tree(tree.root)
+    copy.subtrees = [rebuild(subtree) for subtree in tree.subtrees]
+    return copy
+
+
+def nodes(tree):
+    """ (Tree) -> list of Tree
+    Return every node of tree.
+    """
+    found = [tree]
+    for subtree in tree.subtrees:
+        found += nodes(subtree)
+    return found
+
+
+# Each change goes through a Tree method or a function of the module.
+CHANGES = [
+    ('insert', lambda tree, item: tree.insert(item)),
+    ('delete_item', lambda tree, item: tree.delete_item(item)),
+    ('delete_item2', lambda tree, item: tree.delete_item2(item)),
+    ('delete_leaf', lambda tree, item: tree.is_empty() or tree.delete_leaf()),
+    ('delete_root', lambda tree, item: tree.delete_root()),
+    ('purge_clones', lambda tree, item: tree.purge_clones()),
+    ('add_subtrees', lambda tree, item: tree.add_subtrees([Tree.Tree(item)])),
+    ('make_binary', lambda tree, item: Tree.make_binary(tree)),
+    ('limit_branches', lambda tree, item: Tree.limit_branches(tree, 2)),
+    ('deepen', lambda tree, item: tree.size() > 100 or Tree.deepen(tree)),
+]
+
+
+class TestDigest(unittest.TestCase):
+
+    def test_cached_digests_follow_changes(self):
+        rng = random.Random(19)
+        random.seed(19)    # Tree.insert picks subtrees at random
+        for trial in range(100):
+            tree = Tree.Tree()
+            for i in range(rng.randint(1, 30)):
+                tree.insert(rng.randrange(7))
+            for step in range(15):
+                name, change = rng.choice(CHANGES)
+                with self.subTest(trial=trial, step=step, change=name):
+                    tree.digest()
+                    change(tree, rng.randrange(7))
+                    tree.digest()
+                    for node in nodes(tree):
+                        self.assertEqual(node._digest, fresh_digest(node))
+                    copy = rebuild(tree)
+                    copy.digest()
+                    self.assertEqual(tree, copy)
+
+
+    def test_differing_digests(self):
+        tree = Tree.Tree(1)
+        tree.add_subtrees([Tree.Tree(2), Tree.Tree(3)])
+        other = rebuild(tree)
+        self.assertEqual(tree.digest(), other.digest())
+        other.subtrees[1].insert(4)
+        other.invalidate()
+        self.assertNotEqual(tree, other)
+        other.digest()
+        self.assertNotEqual(tree, other)
+        self.assertNotEqual(tree.digest(), other.digest())
+
+
+    def test_equality(self):
+        tree = Tree.Tree(1)
+        tree.add_subtrees([Tree.Tree(2)])
+        other = Tree.Tree(1)
+        other.add_subtrees([Tree.Tree(2), Tree.Tree(3)])
+        self.assertNotEqual(tree, other)
+        self.assertEqual(Tree.Tree(), Tree.Tree())
+        self.assertNotEqual(Tree.Tree(), Tree.Tree(1))
+        self.assertNotEqual(tree, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()